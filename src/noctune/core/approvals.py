@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
-from .state import now_iso, save_json, sha256_text
+from .state import now_iso, save_json, sha256_text, write_bytes_durable
 
 
 @dataclass
@@ -109,9 +109,11 @@ def read_decision(state_dir: str, approval_id: str) -> Optional[dict[str, Any]]:
 def write_decision(
     state_dir: str, approval_id: str, *, approved: bool, reason: str = ""
 ) -> None:
+    # Durable write: a waiting run acts on this file, so it must never be seen
+    # half-written or lost after the caller was told it was recorded.
     p = decision_path(state_dir, approval_id)
-    os.makedirs(os.path.dirname(p), exist_ok=True)
-    Path(p).write_text(
+    write_bytes_durable(
+        p,
         json.dumps(
             {
                 "approved": bool(approved),
@@ -119,8 +121,7 @@ def write_decision(
                 "decided_at": now_iso(),
             },
             ensure_ascii=False,
-        ),
-        encoding="utf-8",
+        ).encode("utf-8"),
     )
 
 
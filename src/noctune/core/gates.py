@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import ast
 import json
 import subprocess
 from pathlib import Path
@@ -10,7 +9,10 @@ from typing import Any
 def check_parse(file_abs: str) -> tuple[bool, str | None]:
     try:
         source = Path(file_abs).read_text(encoding="utf-8", errors="replace")
-        ast.parse(source)
+        # Compile to bytecode instead of ast.parse: no Python-level AST objects
+        # are materialized, and compile-time errors (e.g. `return` outside a
+        # function) are caught here rather than at import time.
+        compile(source, file_abs, "exec", dont_inherit=True)
         return True, None
     except SyntaxError as e:
         return (
@@ -19,22 +21,31 @@ def check_parse(file_abs: str) -> tuple[bool, str | None]:
         )
 
 
+def _stderr_text(raw: bytes | None) -> str | None:
+    return (raw or b"").decode("utf-8", errors="replace").strip() or None
+
+
 def check_ruff(file_abs: str) -> tuple[bool, Any | None, str | None]:
     try:
+        # Keep stdout as bytes: json.loads accepts UTF-8 bytes directly, so the
+        # diagnostics are never decoded to str just to be parsed again.
         cp = subprocess.run(
             ["ruff", "check", file_abs, "--output-format", "json"],
             capture_output=True,
-            text=True,
             check=False,
         )
     except FileNotFoundError:
         return True, None, "ruff not found on PATH; skipping ruff gate"
     if cp.returncode == 0:
-        return True, [], cp.stderr.strip() or None
+        return True, [], _stderr_text(cp.stderr)
     try:
-        return False, json.loads(cp.stdout or "[]"), cp.stderr.strip() or None
+        return False, json.loads(cp.stdout or b"[]"), _stderr_text(cp.stderr)
     except Exception:
-        return False, cp.stdout[:2000], cp.stderr.strip() or None
+        return (
+            False,
+            cp.stdout[:2000].decode("utf-8", errors="replace"),
+            _stderr_text(cp.stderr),
+        )
 
 
 def ruff_fix_safe(file_abs: str) -> tuple[bool, str | None]:
@@ -42,9 +53,8 @@ def ruff_fix_safe(file_abs: str) -> tuple[bool, str | None]:
         cp = subprocess.run(
             ["ruff", "check", file_abs, "--fix"],
             capture_output=True,
-            text=True,
             check=False,
         )
     except FileNotFoundError:
         return True, "ruff not found on PATH; skipping ruff --fix"
-    return cp.returncode == 0, (cp.stderr.strip() or None)
+    return cp.returncode == 0, _stderr_text(cp.stderr)
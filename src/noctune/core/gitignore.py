@@ -1,15 +1,28 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
 
 from pathspec import PathSpec
 from pathspec.patterns.gitwildmatch import GitWildMatchPattern
 
+# Patterns simple enough to answer with a set lookup (ripgrep/globset-style).
+_NAME_RE = re.compile(r"^[A-Za-z0-9_.-]+$")
+_DIR_RE = re.compile(r"^([A-Za-z0-9_.-]+)/$")
+_EXT_RE = re.compile(r"^\*\.([A-Za-z0-9_-]+)$")
+
 
 @dataclass
 class GitIgnore:
     spec: PathSpec
+    # Fast-path tables; only used when the file has no negation patterns.
+    fast: bool = False
+    names: set[str] = field(default_factory=set)
+    dir_names: set[str] = field(default_factory=set)
+    extensions: set[str] = field(default_factory=set)
+    regex: Optional[re.Pattern[str]] = None
 
     @staticmethod
     def load(repo_root: Path) -> "GitIgnore":
@@ -21,8 +34,52 @@ class GitIgnore:
                 for ln in gi.read_text(encoding="utf-8", errors="ignore").splitlines()
             ]
         spec = PathSpec.from_lines(GitWildMatchPattern, lines)
-        return GitIgnore(spec=spec)
+        out = GitIgnore(spec=spec)
+        out._compile(lines)
+        return out
+
+    def _compile(self, lines: list[str]) -> None:
+        # Only trailing whitespace is insignificant (and only when unescaped);
+        # leading whitespace is part of the pattern, as in PathSpec, so " abc"
+        # never reaches the set lookups and "  #x" is not a comment.
+        pats = [(ln.rstrip(), ln) for ln in lines]
+        pats = [(p, ln) for p, ln in pats if p and not p.startswith("#")]
+        # Negations depend on pattern order; leave those files to PathSpec.
+        if any(p.startswith("!") for p, _ in pats):
+            return
+
+        residual: list[str] = []
+        for p, ln in pats:
+            if _NAME_RE.match(p):
+                self.names.add(p)
+            elif m := _DIR_RE.match(p):
+                self.dir_names.add(m.group(1))
+            elif m := _EXT_RE.match(p):
+                self.extensions.add(m.group(1))
+            else:
+                # Compile the original line so escaped trailing spaces survive.
+                rx = GitWildMatchPattern(ln).regex
+                if rx is not None:
+                    # Named groups may repeat across patterns; make them anonymous.
+                    residual.append(rx.pattern.replace("(?P<ps_d>", "(?:"))
+        if residual:
+            self.regex = re.compile("|".join(f"(?:{r})" for r in residual))
+        self.fast = True
 
     def is_ignored(self, rel_posix: str) -> bool:
         # PathSpec expects posix separators
-        return self.spec.match_file(rel_posix)
+        if not self.fast:
+            return self.spec.match_file(rel_posix)
+
+        # Gitignore patterns without a slash match at any depth, so check every
+        # path component (directories included), not just the basename.
+        parts = rel_posix.split("/")
+        if self.names and not self.names.isdisjoint(parts):
+            return True
+        if self.dir_names and not self.dir_names.isdisjoint(parts[:-1]):
+            return True
+        if self.extensions:
+            for part in parts:
+                if "." in part and part.rpartition(".")[2] in self.extensions:
+                    return True
+        return self.regex is not None and self.regex.match(rel_posix) is not None
@@ -115,12 +115,15 @@ def _llm_chat_logged(
 
 def _impact_pack(root: Path, src_text: str, *, max_names: int = 10):
     syms = extract_symbols(src_text)
+    seen: set[str] = set()
     names: list[str] = []
     for s in syms:
         # grep the leaf name; keep small
-        leaf = s.qname.split(".")[-1]
-        if leaf and leaf not in names:
-            names.append(leaf)
+        leaf = s.qname.rpartition(".")[2]
+        if not leaf or leaf in seen:
+            continue
+        seen.add(leaf)
+        names.append(leaf)
         if len(names) >= max_names:
             break
     return build_impact(str(root), src_text, names)
@@ -169,6 +172,17 @@ def _changed_line_count(before: str, after: str) -> int:
     return cnt
 
 
+# Built once at import; the full-file fallback always sends the same system prompt.
+_FULLFILE_SYSTEM_PROMPT = (
+    "You are a senior Python engineer.\n"
+    "Task: return a FULL corrected replacement for the focus file.\n"
+    "Rules:\n"
+    "- Output ONLY the full Python file content (no prose).\n"
+    "- Avoid sweeping refactors; minimize formatting churn.\n"
+    "- Fix syntax errors and obvious Ruff issues if possible.\n"
+)
+
+
 def _write_full_file_proposal(
     *,
     root: Path,
@@ -194,18 +208,10 @@ def _write_full_file_proposal(
         return
 
     cur = read_bytes(work_abs).decode("utf-8", errors="replace")
-    system = (
-        "You are a senior Python engineer.\n"
-        "Task: return a FULL corrected replacement for the focus file.\n"
-        "Rules:\n"
-        "- Output ONLY the full Python file content (no prose).\n"
-        "- Avoid sweeping refactors; minimize formatting churn.\n"
-        "- Fix syntax errors and obvious Ruff issues if possible.\n"
-    )
     user = f"Path: {rel_path}\nReason: {reason}\n\nCurrent content:\n{cur}"
 
     ok, out = llm.chat(
-        system=system,
+        system=_FULLFILE_SYSTEM_PROMPT,
         user=user,
         stream=True,
         verbose=verbose_llm,
@@ -882,6 +888,8 @@ def _do_edit(
             # Optional safe ruff fix
             if ruff_fix_mode == "safe":
                 ruff_fix_safe(work_abs)
+                # ruff rewrites the work file in place; resync our copy once.
+                temp_bytes = read_bytes(work_abs)
                 parse_ok, parse_err = check_parse(work_abs)
                 ruff_ok, ruff_out, ruff_err = check_ruff(work_abs)
 
@@ -904,7 +912,8 @@ def _do_edit(
                 )[:2000]
 
             # extract current symbol from temp and repair it
-            temp_current_text = read_bytes(work_abs).decode("utf-8", errors="replace")
+            # (temp_bytes mirrors the work file; no need to read it back)
+            temp_current_text = temp_bytes.decode("utf-8", errors="replace")
             temp_syms2 = extract_symbols(temp_current_text)
             temp_map2 = {s.qname: s for s in temp_syms2}
             if qname in temp_map2:
@@ -921,7 +930,7 @@ def _do_edit(
                 if okr and fixed.strip():
                     ar2 = apply_replace_symbol(
                         rel_path=rel_path,
-                        original_bytes=read_bytes(work_abs),
+                        original_bytes=temp_bytes,
                         op_qname=qname,
                         new_code=fixed,
                     )
@@ -967,7 +976,7 @@ def _do_edit(
 
         # Approver (LLM)
         # AFTER symbol code from temp
-        temp_final_text = read_bytes(work_abs).decode("utf-8", errors="replace")
+        temp_final_text = temp_bytes.decode("utf-8", errors="replace")
         temp_syms3 = extract_symbols(temp_final_text)
         temp_map3 = {s.qname: s for s in temp_syms3}
         after_code = (
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 from .gitignore import GitIgnore
 
@@ -16,46 +19,139 @@ HARD_EXCLUDES = {
     ".noctune_cache",
 }
 
+# Stat calls release the GIL, so a wide pool scales with the filesystem's IOPS
+# (network mounts in particular).
+_STAT_WORKERS = 32
+
+
+def _try_stat(p: Path) -> Optional[os.stat_result]:
+    try:
+        return os.stat(p)
+    except OSError:
+        return None
+
+
+def _resolve_py_and_stat(p: Path) -> tuple[Path, Optional[os.stat_result]]:
+    # resolve() lstats every path component, so it is the expensive part and
+    # runs in the pool along with the final stat; non-.py targets skip the stat.
+    try:
+        p = p.resolve()
+    except (OSError, RuntimeError):
+        return p, None
+    if p.suffix != ".py":
+        return p, None
+    return p, _try_stat(p)
+
+
+def _mtime_ns(p: Path) -> int:
+    st = _try_stat(p)
+    return st.st_mtime_ns if st is not None else 0
+
 
 @dataclass
 class RepoScanner:
     root: Path
     gitignore: GitIgnore
+    # dir path -> (st_mtime_ns, subdirs, *.py files). A directory's mtime changes
+    # whenever an entry is added, removed or renamed in it, so unchanged
+    # directories are not re-listed on later scans.
+    _dir_cache: dict[str, tuple[int, list[str], list[str]]] = field(
+        default_factory=dict, repr=False
+    )
+    _gitignore_mtime_ns: int = field(default=0, repr=False)
 
     @staticmethod
     def create(root: Path) -> "RepoScanner":
+        root = root.resolve()
         return RepoScanner(
-            root=root.resolve(), gitignore=GitIgnore.load(root.resolve())
+            root=root,
+            gitignore=GitIgnore.load(root),
+            _gitignore_mtime_ns=_mtime_ns(root / ".gitignore"),
         )
 
-    def iter_python_files(self) -> Iterable[Path]:
+    def _refresh_gitignore(self) -> None:
+        mtime_ns = _mtime_ns(self.root / ".gitignore")
+        if mtime_ns != self._gitignore_mtime_ns:
+            self.gitignore = GitIgnore.load(self.root)
+            self._gitignore_mtime_ns = mtime_ns
+
+    def _list_dir(self, d: str) -> tuple[list[str], list[str]]:
+        st = _try_stat(Path(d))
+        if st is None:
+            return [], []
+        hit = self._dir_cache.get(d)
+        if hit is not None and hit[0] == st.st_mtime_ns:
+            return hit[1], hit[2]
+        subdirs: list[str] = []
+        files: list[str] = []
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            subdirs.append(e.path)
+                        elif e.name.endswith(".py") and e.is_file():
+                            files.append(e.path)
+                    except OSError:
+                        continue
+        except OSError:
+            return [], []
+        subdirs.sort()
+        files.sort()
+        self._dir_cache[d] = (st.st_mtime_ns, subdirs, files)
+        return subdirs, files
+
+    def iter_python_files(self, base: Optional[Path] = None) -> Iterable[Path]:
         root = self.root
+        self._refresh_gitignore()
 
-        for p in root.rglob("*.py"):
-            rel = p.relative_to(root)
+        stack = [str(base.resolve() if base is not None else root)]
+        while stack:
+            d = stack.pop()
+            subdirs, files = self._list_dir(d)
+            for f in files:
+                p = Path(f)
+                rel = p.relative_to(root)
 
-            # hard excludes by top-level folder
-            if rel.parts and rel.parts[0] in HARD_EXCLUDES:
-                continue
+                # hard excludes by top-level folder
+                if rel.parts and rel.parts[0] in HARD_EXCLUDES:
+                    continue
 
-            rel_posix = rel.as_posix()
+                rel_posix = rel.as_posix()
 
-            # honor .gitignore
-            if self.gitignore.is_ignored(rel_posix):
-                continue
+                # honor .gitignore
+                if self.gitignore.is_ignored(rel_posix):
+                    continue
 
-            yield p
+                yield p
+            # Prune hard-excluded top-level folders instead of walking them.
+            stack.extend(
+                sd
+                for sd in reversed(subdirs)
+                if not (d == str(root) and os.path.basename(sd) in HARD_EXCLUDES)
+            )
 
     def from_file_list(self, file_list_path: Path) -> List[Path]:
         root = self.root
         out: List[Path] = []
         txt = file_list_path.read_text(encoding="utf-8", errors="ignore")
+        candidates: List[Path] = []
         for raw in txt.splitlines():
             s = raw.strip()
             if not s or s.startswith("#"):
                 continue
-            p = (root / s).resolve()
-            if not p.exists() or p.suffix != ".py":
+            candidates.append(root / s)
+        if not candidates:
+            return out
+
+        # Resolving and stat'ing are I/O-bound; run them in parallel (order preserved).
+        with ThreadPoolExecutor(
+            max_workers=min(_STAT_WORKERS, len(candidates))
+        ) as ex:
+            resolved = list(ex.map(_resolve_py_and_stat, candidates))
+
+        for p, st in resolved:
+            if st is None or not stat.S_ISREG(st.st_mode):
                 continue
             # apply same excludes/ignore rules
             rel = p.relative_to(root)
@@ -10,12 +10,13 @@ from pathlib import Path
 from typing import Any, Optional
 
 
-def sha256_text(s: str) -> str:
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+def sha256_bytes(b: bytes) -> str:
+    # Content/cache keys only, so opt out of the FIPS "used for security" guard.
+    return hashlib.sha256(b, usedforsecurity=False).hexdigest()
 
 
-def sha256_bytes(b: bytes) -> str:
-    return hashlib.sha256(b).hexdigest()
+def sha256_text(s: str) -> str:
+    return sha256_bytes(s.encode("utf-8"))
 
 
 def now_iso() -> str:
@@ -77,6 +78,29 @@ def save_json(path: str, obj: Any) -> None:
     os.replace(tmp, path)
 
 
+def write_bytes_durable(path: str, data: bytes) -> None:
+    """
+    Atomically replace `path` with `data` and make it survive a crash: the
+    temp file is fsynced before the rename and the directory entry after it.
+    """
+    d = os.path.dirname(path) or "."
+    os.makedirs(d, exist_ok=True)
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+    if hasattr(os, "O_DIRECTORY"):
+        dfd = os.open(d, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dfd)
+        finally:
+            os.close(dfd)
+
+
 def read_text(path: str) -> str:
     with open(path, encoding="utf-8", errors="replace") as f:
         return f.read()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -10,16 +12,32 @@ def which(cmd: str) -> Optional[str]:
     return shutil.which(cmd)
 
 
+@lru_cache(maxsize=1)
+def _ruff_exe() -> Optional[str]:
+    """
+    Resolve the ruff executable once per process.
+    `NOCTUNE_RUFF` (path to a ruff binary) skips the PATH lookup entirely.
+    """
+    override = os.environ.get("NOCTUNE_RUFF")
+    if override:
+        return override
+    return which("ruff")
+
+
+def _decode_output(stdout: bytes | None, stderr: bytes | None) -> str:
+    # Join raw bytes first so the combined output is decoded in a single pass.
+    return ((stdout or b"") + (stderr or b"")).decode("utf-8", errors="replace")
+
+
 def run_ruff_check(path: Path) -> tuple[bool, str]:
     """
     Returns (ok, output). Uses ruff if available.
     """
-    exe = which("ruff")
+    exe = _ruff_exe()
     if not exe:
         return False, "ruff not found on PATH"
-    p = subprocess.run([exe, "check", str(path)], capture_output=True, text=True)
-    out = (p.stdout or "") + (p.stderr or "")
-    return p.returncode == 0, out
+    p = subprocess.run([exe, "check", str(path)], capture_output=True)
+    return p.returncode == 0, _decode_output(p.stdout, p.stderr)
 
 
 def run_ruff_fix_safe(path: Path) -> tuple[bool, str]:
@@ -27,11 +45,8 @@ def run_ruff_fix_safe(path: Path) -> tuple[bool, str]:
     Apply safe fixes only (default behavior of ruff --fix is safe-only unless unsafe is enabled).
     Returns (ok, output) where ok means 'command succeeded', not 'lint is clean'.
     """
-    exe = which("ruff")
+    exe = _ruff_exe()
     if not exe:
         return False, "ruff not found on PATH"
-    p = subprocess.run(
-        [exe, "check", "--fix", str(path)], capture_output=True, text=True
-    )
-    out = (p.stdout or "") + (p.stderr or "")
-    return p.returncode == 0, out
+    p = subprocess.run([exe, "check", "--fix", str(path)], capture_output=True)
+    return p.returncode == 0, _decode_output(p.stdout, p.stderr)
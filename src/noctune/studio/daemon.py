@@ -1,20 +1,39 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import functools
+import os
+import re
+import select
+import sqlite3
 import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
-
-from ..core.run_state import mark_failed_if_pid_gone, read_run_state, update_run_state
-from ..core.state import ensure_run_paths
+from typing import Any, AsyncIterator, Optional
+
+try:
+    # Optional at import time: pydantic ships with the studio extras, which are
+    # only needed to serve the API (create_app reports the missing deps).
+    from pydantic import BaseModel
+except Exception:  # pragma: no cover
+    BaseModel = object  # type: ignore
+
+from ..core.approvals import write_decision
+from ..core.run_state import mark_failed_if_pid_gone, read_run_state
+from . import jsonio
 from .db import (
+    borrow,
     claim_next_job,
+    close_connection,
+    close_pools,
     connect,
     default_db_path,
     enqueue_job,
     finish_job,
     get_run,
+    immediate_txn,
     ingest_run_history,
     list_jobs,
     list_approvals_with_decisions,
@@ -23,7 +42,26 @@ from .db import (
     upsert_run_from_run_json,
     update_job_running,
 )
-from .worker import pid_exists, start_run, stop_run
+from .jsonl import tail_jsonl
+from .worker import child_status, open_pidfd, reap_children, start_run, stop_run
+
+# Upper bound on how long an idle runner sleeps. In-process enqueues wake it
+# immediately; this only bounds pickup latency for jobs enqueued by another
+# process (e.g. the MCP server) that cannot signal our wake pipe.
+_IDLE_POLL_S = 2.0
+
+# The runner's per-iteration probe: the newest running job, else the newest
+# starting one. Kept as one constant so the connection's statement cache hits.
+_ACTIVE_JOB_SQL = (
+    "SELECT job_id, run_id, pid, status FROM jobs "
+    "WHERE repo_root=? AND status IN ('running','starting') "
+    "ORDER BY CASE status WHEN 'running' THEN 0 ELSE 1 END, job_id DESC LIMIT 1"
+)
+
+# A runner may only be evicted while its repo has none of these.
+_PENDING_JOB_SQL = (
+    "SELECT 1 FROM jobs WHERE repo_root=? AND status IN ('queued','starting','running') LIMIT 1"
+)
 
 
 class _RepoJobRunner:
@@ -31,60 +69,183 @@ class _RepoJobRunner:
         self.repo_root = repo_root
         self.db_path = default_db_path(repo_root)
         self._stop = False
+        self._retire = False
         self._lock = threading.Lock()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
 
-    def shutdown(self) -> None:
+    def shutdown(self, *, join_timeout_s: Optional[float] = None) -> None:
         with self._lock:
             self._stop = True
+        self.notify()
+        if join_timeout_s is not None:
+            self.join(timeout_s=join_timeout_s)
+
+    def join(self, *, timeout_s: float) -> None:
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout_s)
+
+    def alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def retire(self) -> None:
+        """Ask the runner to exit if its repo has no queued or active job (LRU eviction)."""
+        with self._lock:
+            self._retire = True
+        self.notify()
+
+    def _keep(self) -> None:
+        # Called under _RUNNERS_LOCK when the runner is handed out again.
+        with self._lock:
+            self._retire = False
+
+    def _try_retire(self, con: sqlite3.Connection) -> bool:
+        """
+        Leave the runner table if retirement was requested and the repo has no
+        pending job. Decided under _RUNNERS_LOCK, so _get_runner either hands
+        this runner out (cancelling the request) or creates a fresh one.
+        """
+        key = str(self.repo_root)
+        with _RUNNERS_LOCK:
+            with self._lock:
+                if not self._retire:
+                    return False
+                self._retire = False
+            if con.execute(_PENDING_JOB_SQL, (key,)).fetchone() is not None:
+                return False
+            if _RUNNERS.get(key) is self:
+                del _RUNNERS[key]
+            return True
+
+    def notify(self) -> None:
+        """Wake the runner thread (new job enqueued, or shutdown requested)."""
+        with self._lock:
+            if self._wake_w < 0:
+                return  # runner already exited and closed its pipe
+            try:
+                os.write(self._wake_w, b"\x01")
+            except OSError:
+                pass  # pipe full: a wake-up is already pending
+
+    def _close(self, con: Optional[sqlite3.Connection]) -> None:
+        if con is not None:
+            close_connection(con)
+        with self._lock:
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = -1
+
+    def _wait(self, pid: Optional[int] = None) -> None:
+        """
+        Block until notify() is called, the watched worker pid exits, or the idle
+        timeout elapses. On Linux the worker is watched through a pidfd, so a
+        busy runner makes no periodic wake-ups at all.
+        """
+        if os.name != "posix":
+            time.sleep(_IDLE_POLL_S)
+            return
+        fds = [self._wake_r]
+        timeout: Optional[float] = _IDLE_POLL_S
+        pidfd = open_pidfd(pid) if pid else None
+        if pidfd is not None:
+            fds.append(pidfd)
+            timeout = None
+        try:
+            # The exited worker is reaped by child_status(), which keeps its exit code.
+            select.select(fds, [], [], timeout)
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
+        try:
+            while os.read(self._wake_r, 4096):
+                pass
+        except OSError:
+            pass
 
     def _loop(self) -> None:
+        # One long-lived connection for the runner thread; handlers use the pool.
+        con: Optional[sqlite3.Connection] = None
         while True:
             with self._lock:
-                if self._stop:
-                    return
+                stop = self._stop
+            if stop:
+                self._close(con)
+                return
 
+            claimed: Optional[int] = None
             try:
-                con = connect(self.db_path)
+                if con is None:
+                    con = connect(self.db_path)
+
+                with self._lock:
+                    retire = self._retire
+                if retire and self._try_retire(con):
+                    self._close(con)
+                    return
+
+                row = con.execute(_ACTIVE_JOB_SQL, (str(self.repo_root),)).fetchone()
+                running = row is not None and row[3] == "running"
 
                 # If any job is running and pid is still alive, do nothing.
-                row = con.execute(
-                    "SELECT job_id, run_id, pid FROM jobs WHERE repo_root=? AND status='running' ORDER BY job_id DESC LIMIT 1",
-                    (str(self.repo_root),),
-                ).fetchone()
-                if row and row[2] and pid_exists(int(row[2])):
-                    time.sleep(2.0)
+                alive, exit_code = child_status(int(row[2])) if running and row[2] else (False, None)
+                if alive:
+                    self._wait(int(row[2]))
                     continue
 
+                # Only this thread moves jobs through 'starting', and it always
+                # finishes before looping, so one seen here was left behind.
+                if row is not None and not running:
+                    finish_job(con, job_id=int(row[0]), status="failed", error="worker did not start")
+
                 # If a running job pid is gone, sync run artifacts into sqlite and mark it terminal.
-                if row and row[2] and not pid_exists(int(row[2])):
-                    job_id, run_id, _pid = int(row[0]), row[1], int(row[2])
-                    terminal_status = "done"
+                if running and row[2]:
+                    job_id, run_id = int(row[0]), row[1]
+                    state_status = ""
                     try:
                         if run_id:
                             state_dir = self.repo_root / ".noctune_cache" / "runs" / str(run_id) / "state"
                             if state_dir.exists():
                                 st = mark_failed_if_pid_gone(str(state_dir))
-                                terminal_status = (
-                                    "failed" if str(st.get("status") or "").lower() == "failed" else "done"
-                                )
-                            upsert_run_from_run_json(con, repo_root=self.repo_root, run_id=str(run_id))
-                            ingest_run_history(con, repo_root=self.repo_root, run_id=str(run_id))
+                                state_status = str(st.get("status") or "").lower()
                     except Exception:
                         pass
-                    finish_job(con, job_id=job_id, status=terminal_status)
+                    # A worker started by this daemon reports its real exit code; a
+                    # non-zero exit is a failure unless the run recorded a clean stop.
+                    failed = state_status == "failed" or (
+                        exit_code not in (None, 0) and state_status != "stopped"
+                    )
+                    terminal_status = "failed" if failed else "done"
+                    # One write transaction (one fsync) for run sync + job completion.
+                    with immediate_txn(con):
+                        try:
+                            if run_id:
+                                upsert_run_from_run_json(
+                                    con, repo_root=self.repo_root, run_id=str(run_id), commit=False
+                                )
+                                ingest_run_history(
+                                    con, repo_root=self.repo_root, run_id=str(run_id), commit=False
+                                )
+                        except Exception:
+                            pass
+                        finish_job(con, job_id=job_id, status=terminal_status, commit=False)
+                    if run_id:
+                        _invalidate_sync(self.repo_root, str(run_id))
 
                 job = claim_next_job(con, repo_root=str(self.repo_root))
                 if not job:
-                    time.sleep(2.0)
+                    self._wait()
                     continue
+                claimed = int(job["job_id"])
 
                 h = start_run(
                     repo_root=self.repo_root,
                     stage=job["stage"],
                     rel_paths=job.get("rel_paths"),
                     extra_args=job.get("extra_args"),
+                    keep_exit_status=True,
                 )
 
                 try:
@@ -99,257 +260,220 @@ class _RepoJobRunner:
                 update_job_running(con, job_id=int(job["job_id"]), run_id=h.run_id, pid=int(h.pid))
             except Exception as e:
                 try:
-                    con = connect(self.db_path)
-                    row = con.execute(
-                        "SELECT job_id FROM jobs WHERE repo_root=? AND status='starting' ORDER BY job_id DESC LIMIT 1",
-                        (str(self.repo_root),),
-                    ).fetchone()
-                    if row:
-                        finish_job(con, job_id=int(row[0]), status="failed", error=str(e))
+                    if con is not None:
+                        if con.in_transaction:
+                            con.rollback()
+                        if claimed is not None:
+                            finish_job(con, job_id=claimed, status="failed", error=str(e))
                 except Exception:
                     pass
-                time.sleep(2.0)
+                self._wait()
 
 
-_RUNNERS: dict[str, _RepoJobRunner] = {}
+# Runners by repo root, least recently used first. Each holds a thread, a wake
+# pipe and a sqlite connection, so the table is bounded: past _MAX_RUNNERS the
+# least recently used runners are asked to retire, and each one leaves only
+# once its repo has no queued or active job (busy runners stay, so the table
+# can briefly exceed the bound). Runners exit on their own thread; nothing
+# here waits for them.
+_MAX_RUNNERS = 32
+_RUNNERS: OrderedDict[str, _RepoJobRunner] = OrderedDict()
+_RUNNERS_LOCK = threading.Lock()
 
 
 def _get_runner(root: Path) -> _RepoJobRunner:
     key = str(root)
-    r = _RUNNERS.get(key)
-    if r is None:
-        r = _RepoJobRunner(root)
-        _RUNNERS[key] = r
+    with _RUNNERS_LOCK:
+        r = _RUNNERS.get(key)
+        if r is not None and not r.alive():
+            del _RUNNERS[key]
+            r = None
+        if r is None:
+            r = _RepoJobRunner(root)
+            _RUNNERS[key] = r
+        else:
+            r._keep()
+        _RUNNERS.move_to_end(key)
+        excess = len(_RUNNERS) - _MAX_RUNNERS
+        if excess > 0:
+            for k, old in list(_RUNNERS.items())[:excess]:
+                if not old.alive():
+                    del _RUNNERS[k]
+                else:
+                    old.retire()
     return r
 
 
-def _tail_events_cursor(
-    events_path: Path, *, cursor: Optional[int] = None, limit: int = 200
-) -> tuple[list[dict[str, Any]], int, int]:
-    if not events_path.exists():
-        return [], 0, 0
-
-    # Simple + reliable: read all lines (runs are typically small). If this becomes
-    # heavy later, replace with chunked seek.
-    raw_lines = events_path.read_text(encoding="utf-8", errors="replace").splitlines()
-    n = len(raw_lines)
-    lim = max(1, int(limit))
-
-    if cursor is None:
-        start = max(0, n - lim)
-    else:
-        start = max(0, min(int(cursor), n))
-
-    end = min(n, start + lim)
-    out: list[dict[str, Any]] = []
-    for ln in raw_lines[start:end]:
-        try:
-            out.append(json.loads(ln))
-        except Exception:
-            continue
-
-    return out, start, end
-
-
-def _pending_approvals(repo_root: Path, run_id: str) -> list[dict[str, Any]]:
-    ad = repo_root / ".noctune_cache" / "runs" / run_id / "state" / "approvals"
-    if not ad.exists():
-        return []
+@atexit.register
+def _shutdown_runners() -> None:
+    with _RUNNERS_LOCK:
+        runners = list(_RUNNERS.values())
+        _RUNNERS.clear()
+    for r in runners:
+        r.shutdown()
+    for r in runners:
+        r.join(timeout_s=5.0)
+    close_pools()
+
+
+def _events_path(repo_root: Path, run_id: str) -> Path:
+    ep = repo_root / ".noctune_cache" / "runs" / run_id / "events" / "events.jsonl"
+    if not ep.exists():
+        ep = repo_root / ".noctune_cache" / "runs" / run_id / "logs" / "events.jsonl"
+    return ep
+
+
+# events_stream checks the file this often; one stat per tick per client while
+# idle (watchfiles/inotify are not dependencies), plus a periodic SSE comment
+# so proxies do not drop quiet connections.
+_STREAM_POLL_S = 0.25
+_STREAM_KEEPALIVE_S = 15.0
+# Most bytes read per tick; a large backlog is streamed in chunks of this size.
+_STREAM_MAX_READ = 1 << 20
+
+
+def _read_appended(path: Path, offset: int) -> tuple[bytes, int]:
+    """
+    Return (complete lines appended at/after `offset`, their start offset),
+    reading at most about _STREAM_MAX_READ bytes (more only to finish a single
+    longer line). A file that shrank below `offset` (truncated or replaced) is
+    re-read from 0.
+    """
+    try:
+        f = path.open("rb")
+    except OSError:
+        return b"", offset
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size < offset:
+            offset = 0
+        if size == offset:
+            return b"", offset
+        f.seek(offset)
+        data = f.read(min(size - offset, _STREAM_MAX_READ))
+        end = data.rfind(b"\n") + 1
+        while end == 0 and offset + len(data) < size:
+            more = f.read(min(size - offset - len(data), _STREAM_MAX_READ))
+            if not more:
+                break
+            nl = more.find(b"\n")
+            if nl >= 0:
+                end = len(data) + nl + 1
+            data += more
+    return data[:end], offset
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve(repo_root: str) -> Path:
+    # Handlers resolve the same few repo roots on every request; resolve() stats
+    # each path component, so remember the answer for the process lifetime.
+    return Path(repo_root).resolve()
+
+
+# Directory mtimes this recent may not yet reflect a change made in the same
+# clock tick (coarse-mtime filesystems), so such listings are never cached.
+_RACY_MTIME_NS = 2_000_000_000
+
+
+@functools.lru_cache(maxsize=256)
+def _scan_pending_approvals(
+    ad_str: str, mtime_ns: int, size: int
+) -> tuple[dict[str, Any], ...]:
+    # One directory listing; decided requests are filtered by name, not by a
+    # per-request stat of the matching .decision file.
+    try:
+        with os.scandir(ad_str) as it:
+            names = [e.name for e in it]
+    except OSError:
+        return ()
+    decided = {n[: -len(".decision")] for n in names if n.endswith(".decision")}
     approvals: list[dict[str, Any]] = []
-    for p in sorted(ad.glob("*.json")):
-        if p.with_suffix(".decision").exists():
+    for name in sorted(n for n in names if n.endswith(".json")):
+        if name[: -len(".json")] in decided:
             continue
         try:
-            approvals.append(json.loads(p.read_text(encoding="utf-8")))
+            with open(os.path.join(ad_str, name), "rb") as f:
+                approvals.append(jsonio.loads(f.read()))
         except Exception:
             continue
-    return approvals
+    return tuple(approvals)
 
 
-def create_app():
+def _pending_approvals(repo_root: Path, run_id: str) -> list[dict[str, Any]]:
+    ad = repo_root / ".noctune_cache" / "runs" / run_id / "state" / "approvals"
     try:
-        from fastapi import FastAPI, HTTPException
-        from fastapi.responses import HTMLResponse
-        from pydantic import BaseModel
-    except Exception as e:
-        raise RuntimeError('Noctune Studio requires extra deps. Install: pip install -e ".[studio]"') from e
-
-    app = FastAPI(title="Noctune Studio API")
-
-    class RunStart(BaseModel):
-        repo_root: str
-        stage: str = "run"
-        rel_paths: Optional[list[str]] = None
-        extra_args: Optional[list[str]] = None
-
-    @app.post("/runs/start")
-    def runs_start(body: RunStart) -> dict[str, Any]:
-        root = Path(body.repo_root).resolve()
-        h = start_run(repo_root=root, stage=body.stage, rel_paths=body.rel_paths, extra_args=body.extra_args)
-        con = connect(default_db_path(root))
-        try:
-            upsert_run_from_run_json(con, repo_root=root, run_id=h.run_id)
-        except Exception:
-            con.execute(
-                "INSERT OR REPLACE INTO runs(run_id, repo_root, stage, rel_paths_json, created_at, status, pid) "
-                "VALUES(?,?,?,?,datetime('now'),?,?)",
-                (h.run_id, str(root), body.stage, None, "running", h.pid),
-            )
-            con.commit()
-        return {"run_id": h.run_id, "pid": h.pid}
-
-    class RunStop(BaseModel):
-        repo_root: str
-
-    @app.post("/runs/{run_id}/stop")
-    def runs_stop(run_id: str, body: RunStop) -> dict[str, Any]:
-        root = Path(body.repo_root).resolve()
-        con = connect(default_db_path(root))
-        row = con.execute("SELECT pid FROM runs WHERE run_id=?", (run_id,)).fetchone()
-        pid = int(row[0]) if row and row[0] else None
-        stop_run(repo_root=root, run_id=run_id, pid=pid)
-        try:
-            rp = ensure_run_paths(str(root), run_id)
-            update_run_state(rp.state_dir, status="stopping", msg="stop requested")
-        except Exception:
-            pass
-        con.execute("UPDATE runs SET status=? WHERE run_id=?", ("stopping", run_id))
-        con.commit()
-        return {"ok": True}
-
-    @app.get("/runs/{run_id}/status")
-    def runs_status(run_id: str, repo_root: str) -> dict[str, Any]:
-        root = Path(repo_root).resolve()
-        state_dir = root / ".noctune_cache" / "runs" / run_id / "state"
-        st = read_run_state(str(state_dir)) if state_dir.exists() else {}
-        if st:
-            # If the worker died, mark the run failed (best-effort).
-            st = mark_failed_if_pid_gone(str(state_dir))
-            try:
-                con = connect(default_db_path(root))
-                upsert_run_from_run_json(con, repo_root=root, run_id=run_id)
-                if str(st.get("status") or "").lower() in ("done", "failed", "stopped"):
-                    ingest_run_history(con, repo_root=root, run_id=run_id)
-            except Exception:
-                pass
-            return st
-
-        # Fallback: legacy sqlite-only status
-        con = connect(default_db_path(root))
-        row = con.execute(
-            "SELECT run_id, status, pid, created_at FROM runs WHERE run_id=?",
-            (run_id,),
-        ).fetchone()
-        if not row:
-            raise HTTPException(status_code=404, detail="run not found")
-        return {"run_id": row[0], "status": row[1], "pid": row[2], "created_at": row[3]}
-
-    @app.get("/runs/list")
-    def runs_list(repo_root: str, limit: int = 50) -> dict[str, Any]:
-        root = Path(repo_root).resolve()
-        con = connect(default_db_path(root))
-        return {"runs": list_runs(con, repo_root=str(root), limit=int(limit))}
-
-    @app.get("/runs/{run_id}/events")
-    def runs_events(
-        run_id: str,
-        repo_root: str,
-        cursor: Optional[int] = None,
-        limit: int = 200,
-        max_lines: int = 200,
-    ) -> dict[str, Any]:
-        root = Path(repo_root).resolve()
-        ep = root / ".noctune_cache" / "runs" / run_id / "events" / "events.jsonl"
-        if not ep.exists():
-            ep = root / ".noctune_cache" / "runs" / run_id / "logs" / "events.jsonl"
-        # Backward-compatible: if callers still use max_lines, it behaves like tail.
-        lim = int(limit) if limit is not None else int(max_lines)
-        events, cur, next_cur = _tail_events_cursor(ep, cursor=cursor, limit=lim)
-        return {"events": events, "cursor": cur, "next_cursor": next_cur}
+        st = os.stat(ad)
+    except OSError:
+        return []
+    # Requests and decisions are created (or atomically replaced) in this
+    # directory, which bumps its mtime; an unchanged mtime means an unchanged list.
+    if time.time_ns() - st.st_mtime_ns < _RACY_MTIME_NS:
+        return list(_scan_pending_approvals.__wrapped__(str(ad), st.st_mtime_ns, st.st_size))
+    return list(_scan_pending_approvals(str(ad), st.st_mtime_ns, st.st_size))
 
-    @app.get("/runs/{run_id}/events_db")
-    def runs_events_db(
-        run_id: str, repo_root: str, cursor: Optional[int] = None, limit: int = 200
-    ) -> dict[str, Any]:
-        root = Path(repo_root).resolve()
-        con = connect(default_db_path(root))
-        try:
-            upsert_run_from_run_json(con, repo_root=root, run_id=run_id)
-            ingest_run_history(con, repo_root=root, run_id=run_id)
-        except Exception:
-            pass
-        events, cur, next_cur = tail_events(con, run_id=run_id, cursor=cursor, limit=limit)
-        return {"events": events, "cursor": cur, "next_cursor": next_cur}
 
-    @app.get("/runs/{run_id}/approvals")
-    def runs_approvals(run_id: str, repo_root: str) -> dict[str, Any]:
-        root = Path(repo_root).resolve()
-        return {"approvals": _pending_approvals(root, run_id)}
+# (repo_root, run_id) -> (run.json signature, history signature) as of the last
+# successful sync into sqlite. Polling endpoints skip the file reads and upserts
+# while neither signature has changed.
+_SYNCED: dict[tuple[str, str], tuple[tuple[int, ...], tuple[int, ...]]] = {}
+_SYNCED_LOCK = threading.Lock()
 
-    @app.get("/runs/{run_id}/audit")
-    def runs_audit(run_id: str, repo_root: str) -> dict[str, Any]:
-        root = Path(repo_root).resolve()
-        con = connect(default_db_path(root))
-        try:
-            upsert_run_from_run_json(con, repo_root=root, run_id=run_id)
-            ingest_run_history(con, repo_root=root, run_id=run_id)
-        except Exception:
-            pass
-        run = get_run(con, run_id=run_id)
-        if not run:
-            raise HTTPException(status_code=404, detail="run not found")
-        return {"run": run, "approvals": list_approvals_with_decisions(con, run_id=run_id)}
-
-    class ApprovalDecision(BaseModel):
-        repo_root: str
-        approved: bool
-        reason: str = ""
 
-    @app.post("/runs/{run_id}/approvals/{approval_id}")
-    def runs_approvals_decide(run_id: str, approval_id: str, body: ApprovalDecision) -> dict[str, Any]:
-        root = Path(body.repo_root).resolve()
-        ad = root / ".noctune_cache" / "runs" / run_id / "state" / "approvals"
-        ad.mkdir(parents=True, exist_ok=True)
-        (ad / f"{approval_id}.decision").write_text(
-            json.dumps({"approved": bool(body.approved), "reason": body.reason}, ensure_ascii=False),
-            encoding="utf-8",
-        )
+def _stat_signature(paths: list[Path]) -> Optional[tuple[int, ...]]:
+    """(mtime_ns, size) of each path (zeros if missing); None if too fresh to trust."""
+    now = time.time_ns()
+    sig: list[int] = []
+    for p in paths:
         try:
-            con = connect(default_db_path(root))
-            ingest_run_history(con, repo_root=root, run_id=run_id)
-        except Exception:
-            pass
-        return {"ok": True}
-
-    # Queue endpoints (single-repo sequential runner)
-    class JobEnqueue(BaseModel):
-        repo_root: str
-        stage: str = "run"
-        rel_paths: Optional[list[str]] = None
-        extra_args: Optional[list[str]] = None
-
-    @app.post("/jobs/enqueue")
-    def jobs_enqueue(body: JobEnqueue) -> dict[str, Any]:
-        root = Path(body.repo_root).resolve()
-        con = connect(default_db_path(root))
-        jid = enqueue_job(
-            con,
-            repo_root=str(root),
-            stage=body.stage,
-            rel_paths=body.rel_paths,
-            extra_args=body.extra_args,
-        )
-        _get_runner(root)
-        return {"job_id": jid, "status": "queued"}
-
-    @app.get("/jobs/list")
-    def jobs_list(repo_root: str, limit: int = 50) -> dict[str, Any]:
-        root = Path(repo_root).resolve()
-        con = connect(default_db_path(root))
-        return {"jobs": list_jobs(con, repo_root=str(root), limit=int(limit))}
-
-    # Minimal approve UI
-    UI_HOME = """<!doctype html>
+            st = os.stat(p)
+        except OSError:
+            sig += (0, 0)
+            continue
+        if now - st.st_mtime_ns < _RACY_MTIME_NS:
+            return None
+        sig += (st.st_mtime_ns, st.st_size)
+    return tuple(sig)
+
+
+def _invalidate_sync(repo_root: Path, run_id: str) -> None:
+    with _SYNCED_LOCK:
+        _SYNCED.pop((str(repo_root), run_id), None)
+
+
+def _sync_run(con: sqlite3.Connection, repo_root: Path, run_id: str) -> None:
+    """Upsert the run row and ingest its history, skipping whatever is unchanged."""
+    rd = repo_root / ".noctune_cache" / "runs" / run_id
+    run_sig = _stat_signature([rd / "state" / "run.json"])
+    # Events are appended (size/mtime change) and approvals/decisions are
+    # created or renamed into their directory (its mtime changes).
+    hist_sig = _stat_signature(
+        [
+            rd / "events" / "events.jsonl",
+            rd / "logs" / "events.jsonl",
+            rd / "state" / "approvals",
+        ]
+    )
+    key = (str(repo_root), run_id)
+    with _SYNCED_LOCK:
+        last = _SYNCED.get(key)
+    do_run = run_sig is None or last is None or last[0] != run_sig
+    do_hist = hist_sig is None or last is None or last[1] != hist_sig
+    if not (do_run or do_hist):
+        return
+    with immediate_txn(con):
+        if do_run:
+            upsert_run_from_run_json(con, repo_root=repo_root, run_id=run_id, commit=False)
+        if do_hist:
+            ingest_run_history(con, repo_root=repo_root, run_id=run_id, commit=False)
+    with _SYNCED_LOCK:
+        if run_sig is None or hist_sig is None:
+            _SYNCED.pop(key, None)
+        else:
+            _SYNCED[key] = (run_sig, hist_sig)
+
+
+# Minimal approve UI
+UI_HOME = """<!doctype html>
 <html>
   <head>
     <meta charset=\"utf-8\"/>
@@ -379,11 +503,8 @@ def create_app():
   </body>
 </html>"""
 
-    @app.get("/ui", response_class=HTMLResponse)
-    def ui_home() -> str:
-        return UI_HOME
 
-    UI_RUN_TMPL = """<!doctype html>
+UI_RUN_TMPL = """<!doctype html>
 <html>
   <head>
     <meta charset=\"utf-8\"/>
@@ -446,17 +567,306 @@ def create_app():
   </body>
 </html>"""
 
-    @app.get("/ui/run/{run_id}", response_class=HTMLResponse)
-    def ui_run(run_id: str, repo_root: str) -> str:
-        repo = Path(repo_root).resolve()
-        approvals = _pending_approvals(repo, run_id)
-        payload = json.dumps(approvals, ensure_ascii=False)
-        return (
-            UI_RUN_TMPL.replace("__RUN_ID__", run_id)
-            .replace("__REPO__", str(repo))
-            .replace("__REPO_JSON__", json.dumps(str(repo)))
-            .replace("__RUN_ID_JSON__", json.dumps(run_id))
-            .replace("__APPROVALS__", payload)
+_PLACEHOLDER_RE = re.compile(r"__([A-Z_]+)__")
+
+
+def _compile_template(tmpl: str) -> list[str]:
+    # re.split with one group alternates: literal, key, literal, key, ..., literal
+    return _PLACEHOLDER_RE.split(tmpl)
+
+
+def _render_template(parts: list[str], values: dict[str, str]) -> str:
+    """Single-pass render: substituted values are never re-scanned for placeholders."""
+    out = list(parts)
+    out[1::2] = [values[k] for k in parts[1::2]]
+    return "".join(out)
+
+
+_UI_RUN_PARTS = _compile_template(UI_RUN_TMPL)
+
+
+# Request bodies live at module scope so they are built once per process, and
+# so FastAPI can resolve the (postponed) annotations on the route handlers.
+class RunStart(BaseModel):
+    repo_root: str
+    stage: str = "run"
+    rel_paths: Optional[list[str]] = None
+    extra_args: Optional[list[str]] = None
+
+
+class RunStop(BaseModel):
+    repo_root: str
+
+
+class ApprovalDecision(BaseModel):
+    repo_root: str
+    approved: bool
+    reason: str = ""
+
+
+class JobEnqueue(BaseModel):
+    repo_root: str
+    stage: str = "run"
+    rel_paths: Optional[list[str]] = None
+    extra_args: Optional[list[str]] = None
+
+
+_APP: Any = None
+
+
+def create_app():
+    """Build the Studio API once per process; later calls return the same app."""
+    global _APP
+    if _APP is not None:
+        return _APP
+    try:
+        from fastapi import FastAPI, Header, HTTPException
+        from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+    except Exception as e:
+        raise RuntimeError('Noctune Studio requires extra deps. Install: pip install -e ".[studio]"') from e
+    if BaseModel is object:
+        raise RuntimeError('Noctune Studio requires extra deps. Install: pip install -e ".[studio]"')
+
+    class _JSONResponse(JSONResponse):
+        def render(self, content: Any) -> bytes:
+            return jsonio.dumps(content)
+
+    app = FastAPI(title="Noctune Studio API", default_response_class=_JSONResponse)
+
+    @app.post("/runs/start")
+    def runs_start(body: RunStart) -> dict[str, Any]:
+        root = _resolve(body.repo_root)
+        h = start_run(repo_root=root, stage=body.stage, rel_paths=body.rel_paths, extra_args=body.extra_args)
+        with borrow(default_db_path(root), write=True) as con:
+            try:
+                upsert_run_from_run_json(con, repo_root=root, run_id=h.run_id)
+            except Exception:
+                con.execute(
+                    "INSERT OR REPLACE INTO runs(run_id, repo_root, stage, rel_paths_json, created_at, status, pid) "
+                    "VALUES(?,?,?,?,datetime('now'),?,?)",
+                    (h.run_id, str(root), body.stage, None, "running", h.pid),
+                )
+                con.commit()
+        return {"run_id": h.run_id, "pid": h.pid}
+
+    @app.post("/runs/{run_id}/stop")
+    def runs_stop(run_id: str, body: RunStop) -> dict[str, Any]:
+        root = _resolve(body.repo_root)
+        db_path = default_db_path(root)
+        with borrow(db_path) as con:
+            row = con.execute("SELECT pid FROM runs WHERE run_id=?", (run_id,)).fetchone()
+        pid = int(row[0]) if row and row[0] else None
+        # stop_run fsyncs stop.flag, writes run state and signals the worker;
+        # none of that may hold the database write lock.
+        stop_run(repo_root=root, run_id=run_id, pid=pid)
+        with borrow(db_path, write=True) as con:
+            con.execute("UPDATE runs SET status=? WHERE run_id=?", ("stopping", run_id))
+            con.commit()
+        _invalidate_sync(root, run_id)
+        return {"ok": True}
+
+    @app.get("/runs/{run_id}/status")
+    def runs_status(run_id: str, repo_root: str) -> dict[str, Any]:
+        root = _resolve(repo_root)
+        state_dir = root / ".noctune_cache" / "runs" / run_id / "state"
+        st = read_run_state(str(state_dir)) if state_dir.exists() else {}
+        if st:
+            # If the worker died, mark the run failed (best-effort). Reap our
+            # own exited workers first: a zombie still passes the pid probe.
+            reap_children()
+            st = mark_failed_if_pid_gone(str(state_dir))
+            try:
+                with borrow(default_db_path(root), write=True) as con:
+                    upsert_run_from_run_json(con, repo_root=root, run_id=run_id)
+                    if str(st.get("status") or "").lower() in ("done", "failed", "stopped"):
+                        ingest_run_history(con, repo_root=root, run_id=run_id)
+            except Exception:
+                pass
+            return st
+
+        # Fallback: legacy sqlite-only status
+        with borrow(default_db_path(root)) as con:
+            row = con.execute(
+                "SELECT run_id, status, pid, created_at FROM runs WHERE run_id=?",
+                (run_id,),
+            ).fetchone()
+        if not row:
+            raise HTTPException(status_code=404, detail="run not found")
+        return {"run_id": row[0], "status": row[1], "pid": row[2], "created_at": row[3]}
+
+    @app.get("/runs/list")
+    def runs_list(repo_root: str, limit: int = 50) -> dict[str, Any]:
+        root = _resolve(repo_root)
+        with borrow(default_db_path(root)) as con:
+            return {"runs": list_runs(con, repo_root=str(root), limit=int(limit))}
+
+    @app.get("/runs/{run_id}/events")
+    def runs_events(
+        run_id: str,
+        repo_root: str,
+        cursor: Optional[int] = None,
+        limit: int = 200,
+        max_lines: int = 200,
+    ) -> dict[str, Any]:
+        ep = _events_path(_resolve(repo_root), run_id)
+        # Backward-compatible: if callers still use max_lines, it behaves like tail.
+        lim = int(limit) if limit is not None else int(max_lines)
+        events, cur, next_cur = tail_jsonl(ep, cursor=cursor, limit=lim)
+        return {"events": events, "cursor": cur, "next_cursor": next_cur}
+
+    @app.get("/runs/{run_id}/events_stream")
+    async def runs_events_stream(
+        run_id: str,
+        repo_root: str,
+        offset: int = 0,
+        last_event_id: Optional[str] = Header(default=None),
+    ) -> Any:
+        """
+        Server-Sent Events: push each complete events.jsonl line as it is
+        appended. Each event's id is the byte offset just past it. EventSource
+        resends the last one as Last-Event-ID when it reconnects, and that
+        takes priority over `offset`. /events remains for polling.
+        """
+        root = _resolve(repo_root)
+        try:
+            resume = int(last_event_id) if last_event_id else int(offset)
+        except ValueError:
+            resume = int(offset)
+
+        async def gen() -> AsyncIterator[bytes]:
+            pos = max(0, resume)
+            idle_s = 0.0
+            # Ends when the client disconnects (the response cancels us).
+            while True:
+                data, start = await asyncio.to_thread(
+                    _read_appended, _events_path(root, run_id), pos
+                )
+                if data:
+                    out: list[bytes] = []
+                    for ln in data.split(b"\n")[:-1]:
+                        start += len(ln) + 1
+                        if ln.strip():
+                            out.append(b"id: %d\ndata: %s\n\n" % (start, ln))
+                    pos = start
+                    idle_s = 0.0
+                    if out:
+                        yield b"".join(out)
+                    continue  # there may be more backlog beyond this chunk
+                await asyncio.sleep(_STREAM_POLL_S)
+                idle_s += _STREAM_POLL_S
+                if idle_s >= _STREAM_KEEPALIVE_S:
+                    idle_s = 0.0
+                    yield b": keep-alive\n\n"
+
+        return StreamingResponse(
+            gen(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
         )
 
+    @app.get("/runs/{run_id}/events_db")
+    def runs_events_db(
+        run_id: str,
+        repo_root: str,
+        cursor: Optional[int] = None,
+        limit: int = 200,
+        full: bool = False,
+    ) -> dict[str, Any]:
+        root = _resolve(repo_root)
+        db_path = default_db_path(root)
+        # Hold the writer only for the sync; the read runs on a read-only
+        # connection so it never queues behind (or blocks) other writes.
+        with borrow(db_path, write=True) as con:
+            try:
+                _sync_run(con, root, run_id)
+            except Exception:
+                pass
+        with borrow(db_path) as con:
+            events, cur, next_cur = tail_events(
+                con, run_id=run_id, cursor=cursor, limit=limit, full=full
+            )
+        return {"events": events, "cursor": cur, "next_cursor": next_cur}
+
+    @app.get("/runs/{run_id}/approvals")
+    async def runs_approvals(run_id: str, repo_root: str) -> dict[str, Any]:
+        root = _resolve(repo_root)
+        return {"approvals": await asyncio.to_thread(_pending_approvals, root, run_id)}
+
+    @app.get("/runs/{run_id}/audit")
+    def runs_audit(run_id: str, repo_root: str) -> dict[str, Any]:
+        root = _resolve(repo_root)
+        db_path = default_db_path(root)
+        with borrow(db_path, write=True) as con:
+            try:
+                _sync_run(con, root, run_id)
+            except Exception:
+                pass
+        with borrow(db_path) as con:
+            run = get_run(con, run_id=run_id)
+            approvals = list_approvals_with_decisions(con, run_id=run_id) if run else []
+        if not run:
+            raise HTTPException(status_code=404, detail="run not found")
+        return {"run": run, "approvals": approvals}
+
+    @app.post("/runs/{run_id}/approvals/{approval_id}")
+    def runs_approvals_decide(run_id: str, approval_id: str, body: ApprovalDecision) -> dict[str, Any]:
+        root = _resolve(body.repo_root)
+        state_dir = root / ".noctune_cache" / "runs" / run_id / "state"
+        write_decision(str(state_dir), approval_id, approved=bool(body.approved), reason=body.reason)
+        _invalidate_sync(root, run_id)
+        try:
+            with borrow(default_db_path(root), write=True) as con:
+                ingest_run_history(con, repo_root=root, run_id=run_id)
+        except Exception:
+            pass
+        return {"ok": True}
+
+    # Queue endpoints (single-repo sequential runner)
+    @app.post("/jobs/enqueue")
+    def jobs_enqueue(body: JobEnqueue) -> dict[str, Any]:
+        root = _resolve(body.repo_root)
+        with borrow(default_db_path(root), write=True) as con:
+            jid = enqueue_job(
+                con,
+                repo_root=str(root),
+                stage=body.stage,
+                rel_paths=body.rel_paths,
+                extra_args=body.extra_args,
+            )
+        _get_runner(root).notify()
+        return {"job_id": jid, "status": "queued"}
+
+    @app.get("/jobs/list")
+    def jobs_list(repo_root: str, limit: int = 50) -> dict[str, Any]:
+        root = _resolve(repo_root)
+        with borrow(default_db_path(root)) as con:
+            return {"jobs": list_jobs(con, repo_root=str(root), limit=int(limit))}
+
+    @app.get("/admin/runners")
+    def admin_runners() -> dict[str, Any]:
+        with _RUNNERS_LOCK:
+            runners = list(_RUNNERS.items())
+        return {
+            "max_runners": _MAX_RUNNERS,
+            "runners": [{"repo_root": k, "alive": r.alive()} for k, r in runners],
+        }
+
+    @app.get("/ui", response_class=HTMLResponse)
+    def ui_home() -> str:
+        return UI_HOME
+
+    @app.get("/ui/run/{run_id}", response_class=HTMLResponse)
+    async def ui_run(run_id: str, repo_root: str) -> str:
+        repo = _resolve(repo_root)
+        # Scan the approvals dir off the event loop while the rest of the page
+        # values are built.
+        pending = asyncio.create_task(asyncio.to_thread(_pending_approvals, repo, run_id))
+        values = {
+            "RUN_ID": run_id,
+            "REPO": str(repo),
+            "REPO_JSON": jsonio.dumps_str(str(repo)),
+            "RUN_ID_JSON": jsonio.dumps_str(run_id),
+        }
+        values["APPROVALS"] = jsonio.dumps_str(await pending)
+        return _render_template(_UI_RUN_PARTS, values)
+
+    _APP = app
     return app
@@ -1,28 +1,81 @@
 from __future__ import annotations
 
-import json
+import mmap
+import os
 import sqlite3
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from queue import Empty, Full, Queue
+from typing import Any, Iterable, Iterator, Optional
 
 from ..core.state import now_iso
+from . import jsonio
 
 
-def _try_json_loads(raw: str) -> Optional[dict[str, Any]]:
+def _try_json_loads(raw: str | bytes) -> Optional[dict[str, Any]]:
     try:
-        obj = json.loads(raw)
+        obj = jsonio.loads(raw)
         return obj if isinstance(obj, dict) else None
     except Exception:
         return None
 
 
+# payload_json columns hold the UTF-8 JSON as a BLOB (no text round-trip on
+# ingest or read). Payloads above _COMPRESS_MIN bytes are stored
+# zlib-compressed behind a 0x01 marker byte, which no JSON text starts with.
+# Rows written before this may still be TEXT; readers accept both.
+_COMPRESS_MIN = 512
+_ZLIB_MARK = b"\x01"
+
+
+def _pack_payload(data: bytes) -> bytes:
+    if len(data) > _COMPRESS_MIN:
+        packed = _ZLIB_MARK + zlib.compress(data, 1)
+        if len(packed) < len(data):
+            return packed
+    return data
+
+
+def _unpack_payload(raw: str | bytes) -> str | bytes:
+    if isinstance(raw, bytes) and raw[:1] == _ZLIB_MARK:
+        return zlib.decompress(memoryview(raw)[1:])
+    return raw
+
+
+def _payload_text(raw: str | bytes) -> str:
+    data = _unpack_payload(raw)
+    return data.decode("utf-8", errors="replace") if isinstance(data, bytes) else data
+
+
+@lru_cache(maxsize=4096)
+def _parse_payload_cached(raw: str | bytes) -> Any:
+    return jsonio.loads(_unpack_payload(raw))
+
+
+def _parse_payload(raw: str | bytes) -> Optional[dict[str, Any]]:
+    """
+    Parse a stored payload_json. Polling re-reads the same rows, so parses
+    (and decompression) are memoized by the stored value; callers get their
+    own top-level dict.
+    """
+    try:
+        obj = _parse_payload_cached(raw)
+    except Exception:
+        return None
+    return dict(obj) if isinstance(obj, dict) else None
+
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS runs (
   run_id TEXT PRIMARY KEY,
   repo_root TEXT NOT NULL,
   stage TEXT NOT NULL,
   rel_paths_json TEXT,
-  created_at TEXT NOT NULL,
+  created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now')),
   status TEXT NOT NULL,
   pid INTEGER,
   last_heartbeat TEXT,
@@ -43,7 +96,7 @@ CREATE TABLE IF NOT EXISTS jobs (
   stage TEXT NOT NULL,
   rel_paths_json TEXT,
   extra_args_json TEXT,
-  created_at TEXT NOT NULL,
+  created_at TEXT NOT NULL DEFAULT (datetime('now')),
   status TEXT NOT NULL,
   run_id TEXT,
   pid INTEGER,
@@ -53,13 +106,19 @@ CREATE TABLE IF NOT EXISTS jobs (
 CREATE INDEX IF NOT EXISTS idx_jobs_repo_status_created
   ON jobs(repo_root, status, created_at);
 
+-- Runner hot paths: look up by (repo_root, status) in job_id order; run_id and
+-- pid are carried along so the runner's active-job probe never touches the table.
+CREATE INDEX IF NOT EXISTS idx_jobs_repo_status_jobid
+  ON jobs(repo_root, status, job_id DESC, run_id, pid);
+
 -- Audit trail (v1): store run events + approvals/decisions in sqlite for durable history.
 CREATE TABLE IF NOT EXISTS events (
   run_id TEXT NOT NULL,
   idx INTEGER NOT NULL,
   ts TEXT,
   type TEXT,
-  payload_json TEXT NOT NULL,
+  msg TEXT,
+  payload_json BLOB NOT NULL,
   PRIMARY KEY (run_id, idx)
 );
 
@@ -72,10 +131,14 @@ CREATE TABLE IF NOT EXISTS approvals (
   risk_score REAL,
   reason TEXT,
   diff TEXT,
-  payload_json TEXT NOT NULL,
+  payload_json BLOB NOT NULL,
   PRIMARY KEY (run_id, approval_id)
 );
 
+-- Run-detail listing: ORDER BY created_at, approval_id straight off the index.
+CREATE INDEX IF NOT EXISTS idx_approvals_run_created
+  ON approvals(run_id, created_at, approval_id);
+
 CREATE TABLE IF NOT EXISTS decisions (
   run_id TEXT NOT NULL,
   approval_id TEXT NOT NULL,
@@ -83,24 +146,224 @@ CREATE TABLE IF NOT EXISTS decisions (
   decided_at TEXT,
   decided_by TEXT,
   reason TEXT,
-  payload_json TEXT NOT NULL,
+  payload_json BLOB NOT NULL,
   PRIMARY KEY (run_id, approval_id)
 );
 """
 
 
+@lru_cache(maxsize=256)
 def default_db_path(repo_root: Path) -> Path:
     return repo_root / ".noctune_cache" / "noctune_studio.db"
 
 
-def connect(db_path: Path) -> sqlite3.Connection:
+# Applied once per connection when it is opened (pooled connections keep them).
+# In WAL mode synchronous=NORMAL fsyncs only at checkpoints: commits survive an
+# application crash, and at worst the last commits are lost on power failure.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache for bulk ingestion
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA wal_autocheckpoint=1000",
+    "PRAGMA busy_timeout=5000",
+)
+# Read-only connections skip the settings that would need a write.
+_READ_PRAGMAS = tuple(
+    p for p in _PRAGMAS if "journal_mode" not in p and "wal_autocheckpoint" not in p
+)
+
+
+def connect(db_path: Path, *, check_same_thread: bool = False) -> sqlite3.Connection:
+    """
+    Open (and migrate) the studio database. Connections may be shared across
+    threads (check_same_thread=False) but must not be used concurrently:
+    writes go through the single pooled writer (`borrow(write=True)`), a
+    `DbWriter` thread, or the runner thread's own connection.
+    """
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    con = sqlite3.connect(str(db_path), check_same_thread=False)
-    con.execute("PRAGMA journal_mode=WAL;")
+    key = str(db_path)
+    # Schema and migrations run once per database per process (again if the
+    # file has been removed meanwhile), not on every pooled or ad-hoc open.
+    with _MIGRATED_LOCK:
+        migrate = key not in _MIGRATED or not db_path.exists()
+    con = sqlite3.connect(key, check_same_thread=check_same_thread)
+    # Rows index like tuples and convert with dict(row) in C.
+    con.row_factory = sqlite3.Row
+    for pragma in _PRAGMAS:
+        con.execute(pragma)
+    if migrate:
+        _migrate(con)
+        with _MIGRATED_LOCK:
+            _MIGRATED.add(key)
+    return con
+
+
+def connect_ro(db_path: Path) -> sqlite3.Connection:
+    """
+    Open a read-only connection (URI mode=ro). It never takes a write lock, and
+    in WAL mode it reads alongside the writer. The database is created and
+    migrated first if this process has not done so yet.
+    """
+    with _MIGRATED_LOCK:
+        ready = str(db_path) in _MIGRATED and db_path.exists()
+    if not ready:
+        connect(db_path).close()
+    con = sqlite3.connect(
+        f"{db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+    )
+    con.row_factory = sqlite3.Row
+    for pragma in _READ_PRAGMAS:
+        con.execute(pragma)
+    return con
+
+
+_MIGRATED: set[str] = set()
+_MIGRATED_LOCK = threading.Lock()
+
+
+def _migrate(con: sqlite3.Connection) -> None:
+    fresh_indexes = (
+        con.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_jobs_repo_status_jobid'"
+        ).fetchone()
+        is None
+    )
     con.executescript(SCHEMA)
     _ensure_runs_columns(con)
+    _ensure_events_columns(con)
+    if fresh_indexes:
+        # Give the planner statistics for the new indexes (once per database).
+        con.execute("ANALYZE jobs")
+    con.commit()
+
+
+# Per-database connection pools: one writer slot (SQLite is single-writer, so
+# writers queue here instead of on the file lock) plus a few reusable readers.
+# Each pooled connection carries the inode of the file it opened; if the file
+# is removed or replaced (e.g. .noctune_cache deleted under a running daemon)
+# the connection is reopened instead of writing to the unlinked inode.
+_POOL_READERS = 4
+_Pooled = tuple[Optional[sqlite3.Connection], int]
+_POOLS: dict[str, tuple[Queue[_Pooled], Queue[_Pooled]]] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _db_ino(db_path: Path) -> int:
+    try:
+        return os.stat(db_path).st_ino
+    except OSError:
+        return -1
+
+
+def _pools(db_path: Path) -> tuple[Queue[_Pooled], Queue[_Pooled]]:
+    key = str(db_path)
+    with _POOLS_LOCK:
+        pools = _POOLS.get(key)
+        if pools is None:
+            writers: Queue[_Pooled] = Queue(maxsize=1)
+            writers.put((None, -1))  # opened on first checkout
+            pools = (writers, Queue(maxsize=_POOL_READERS))
+            _POOLS[key] = pools
+    return pools
+
+
+def close_connection(con: sqlite3.Connection) -> None:
+    """Close a connection, first letting SQLite refresh stale planner statistics."""
+    try:
+        con.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        pass
+    con.close()
+
+
+def close_pools() -> None:
+    """Close every idle pooled connection and forget the pools (e.g. at exit)."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for q in (q for pair in pools for q in pair):
+        while True:
+            try:
+                con, _ = q.get_nowait()
+            except Empty:
+                break
+            if con is not None:
+                close_connection(con)
+
+
+def _checkout_writer(writers: Queue[_Pooled], db_path: Path) -> _Pooled:
+    con, ino = writers.get()
+    try:
+        if con is None or _db_ino(db_path) != ino:
+            if con is not None:
+                close_connection(con)
+                con = None
+            con = connect(db_path)
+            ino = _db_ino(db_path)
+    except BaseException:
+        writers.put((None, -1))  # never lose the slot
+        raise
+    return con, ino
+
+
+def _checkout_reader(readers: Queue[_Pooled], db_path: Path) -> _Pooled:
+    cur = _db_ino(db_path)
+    while True:
+        try:
+            con, ino = readers.get_nowait()
+        except Empty:
+            break
+        if con is not None and ino == cur:
+            return con, ino
+        if con is not None:
+            con.close()  # opened on a file that has since been removed or replaced
+    return connect_ro(db_path), _db_ino(db_path)
+
+
+@contextmanager
+def borrow(db_path: Path, *, write: bool = False) -> Iterator[sqlite3.Connection]:
+    """
+    Check a pooled connection out for the duration of a `with` block.
+    Writers share one connection and are serialized; readers get read-only
+    connections (`connect_ro`), reusing up to `_POOL_READERS` idle ones. Do not
+    nest write borrows in one thread.
+    """
+    writers, readers = _pools(db_path)
+    if write:
+        con, ino = _checkout_writer(writers, db_path)
+    else:
+        con, ino = _checkout_reader(readers, db_path)
+    try:
+        yield con
+    finally:
+        if con.in_transaction:
+            con.rollback()
+        if write:
+            writers.put((con, ino))
+        else:
+            try:
+                readers.put_nowait((con, ino))
+            except Full:
+                con.close()
+
+
+@contextmanager
+def immediate_txn(con: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Group several writes into one BEGIN IMMEDIATE ... COMMIT (one fsync).
+    Helpers called inside must be passed `commit=False`. Rolls back on error.
+    """
+    if con.in_transaction:
+        con.commit()
+    con.execute("BEGIN IMMEDIATE")
+    try:
+        yield con
+    except BaseException:
+        con.rollback()
+        raise
     con.commit()
-    return con
 
 
 def _ensure_runs_columns(con: sqlite3.Connection) -> None:
@@ -115,19 +378,27 @@ def _ensure_runs_columns(con: sqlite3.Connection) -> None:
         "ended_at": "TEXT",
         "exit_code": "INTEGER",
     }
+    _add_missing_columns(con, "runs", cols)
+
+
+def _ensure_events_columns(con: sqlite3.Connection) -> None:
+    _add_missing_columns(con, "events", {"msg": "TEXT"})
+
+
+def _add_missing_columns(con: sqlite3.Connection, table: str, cols: dict[str, str]) -> None:
+    # One catalog read instead of an ALTER (and a caught error) per column.
+    existing = {r[1] for r in con.execute(f"PRAGMA table_info({table})")}
     for name, typ in cols.items():
-        try:
-            con.execute(f"ALTER TABLE runs ADD COLUMN {name} {typ}")
-        except Exception:
-            pass
+        if name not in existing:
+            con.execute(f"ALTER TABLE {table} ADD COLUMN {name} {typ}")
 
 
 def _dumps(obj: Any) -> str | None:
-    return None if obj is None else json.dumps(obj, ensure_ascii=False)
+    return None if obj is None else jsonio.dumps_str(obj)
 
 
 def _loads(s: str | None) -> Any:
-    return None if not s else json.loads(s)
+    return None if not s else jsonio.loads(s)
 
 
 def enqueue_job(
@@ -137,13 +408,15 @@ def enqueue_job(
     stage: str,
     rel_paths: Optional[list[str]] = None,
     extra_args: Optional[list[str]] = None,
+    commit: bool = True,
 ) -> int:
     cur = con.execute(
         "INSERT INTO jobs(repo_root, stage, rel_paths_json, extra_args_json, created_at, status) "
         "VALUES(?,?,?,?,datetime('now'),?)",
         (repo_root, stage, _dumps(rel_paths), _dumps(extra_args), "queued"),
     )
-    con.commit()
+    if commit:
+        con.commit()
     return int(cur.lastrowid)
 
 
@@ -155,18 +428,7 @@ def list_jobs(
         "WHERE repo_root=? ORDER BY job_id DESC LIMIT ?",
         (repo_root, int(limit)),
     ).fetchall()
-    return [
-        {
-            "job_id": r[0],
-            "stage": r[1],
-            "status": r[2],
-            "created_at": r[3],
-            "run_id": r[4],
-            "pid": r[5],
-            "error": r[6],
-        }
-        for r in rows
-    ]
+    return [dict(r) for r in rows]
 
 
 def list_runs(
@@ -177,37 +439,40 @@ def list_runs(
         "FROM runs WHERE repo_root=? ORDER BY created_at DESC LIMIT ?",
         (repo_root, int(limit)),
     ).fetchall()
-    return [
-        {
-            "run_id": r[0],
-            "stage": r[1],
-            "status": r[2],
-            "created_at": r[3],
-            "pid": r[4],
-            "pack": r[5],
-            "profile": r[6],
-            "branch": r[7],
-            "head_sha": r[8],
-            "error": r[9],
-        }
-        for r in rows
-    ]
+    return [dict(r) for r in rows]
+
+
+_CLAIM_NEXT_JOB_SQL = (
+    "UPDATE jobs SET status='starting' WHERE job_id = ("
+    "SELECT job_id FROM jobs WHERE repo_root=? AND status='queued' ORDER BY job_id ASC LIMIT 1"
+    ") RETURNING job_id, stage, rel_paths_json, extra_args_json"
+)
+
+
+# RETURNING needs SQLite >= 3.35; Python links the system library, which is
+# older on some supported distributions (e.g. 3.31 on Ubuntu 20.04).
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
 
 
 def claim_next_job(con: sqlite3.Connection, *, repo_root: str) -> Optional[dict[str, Any]]:
-    # Atomic-ish claim: select then update inside immediate txn.
-    con.execute("BEGIN IMMEDIATE")
-    row = con.execute(
-        "SELECT job_id, stage, rel_paths_json, extra_args_json FROM jobs "
-        "WHERE repo_root=? AND status='queued' ORDER BY job_id ASC LIMIT 1",
-        (repo_root,),
-    ).fetchone()
+    if _HAS_RETURNING:
+        # Atomic claim: one UPDATE ... RETURNING picks and marks the oldest
+        # queued job; the row must be fetched before committing.
+        row = con.execute(_CLAIM_NEXT_JOB_SQL, (repo_root,)).fetchone()
+        con.commit()
+    else:
+        # Same claim as select-then-update inside one immediate transaction.
+        with immediate_txn(con):
+            row = con.execute(
+                "SELECT job_id, stage, rel_paths_json, extra_args_json FROM jobs "
+                "WHERE repo_root=? AND status='queued' ORDER BY job_id ASC LIMIT 1",
+                (repo_root,),
+            ).fetchone()
+            if row:
+                con.execute("UPDATE jobs SET status='starting' WHERE job_id=?", (row[0],))
     if not row:
-        con.execute("COMMIT")
         return None
     job_id, stage, rel_paths_json, extra_args_json = row
-    con.execute("UPDATE jobs SET status='starting' WHERE job_id=?", (job_id,))
-    con.execute("COMMIT")
     return {
         "job_id": int(job_id),
         "stage": stage,
@@ -217,27 +482,50 @@ def claim_next_job(con: sqlite3.Connection, *, repo_root: str) -> Optional[dict[
 
 
 def update_job_running(
-    con: sqlite3.Connection, *, job_id: int, run_id: str, pid: int
+    con: sqlite3.Connection, *, job_id: int, run_id: str, pid: int, commit: bool = True
 ) -> None:
     con.execute(
         "UPDATE jobs SET status='running', run_id=?, pid=? WHERE job_id=?",
         (run_id, int(pid), int(job_id)),
     )
-    con.commit()
+    if commit:
+        con.commit()
 
 
 def finish_job(
-    con: sqlite3.Connection, *, job_id: int, status: str, error: str | None = None
+    con: sqlite3.Connection,
+    *,
+    job_id: int,
+    status: str,
+    error: str | None = None,
+    commit: bool = True,
 ) -> None:
     con.execute(
         "UPDATE jobs SET status=?, error=? WHERE job_id=?",
         (status, error, int(job_id)),
     )
-    con.commit()
+    if commit:
+        con.commit()
+
+
+# Native UPSERT: one statement, and unlike INSERT OR REPLACE it updates the
+# row in place, so created_at (and columns run.json does not carry, such as
+# last_heartbeat) survive re-syncs.
+_UPSERT_RUN_SQL = (
+    "INSERT INTO runs(run_id, repo_root, stage, rel_paths_json, created_at, status, pid, pack, profile, branch, head_sha, error, started_at, updated_at, ended_at, exit_code) "
+    "VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?) "
+    "ON CONFLICT(run_id) DO UPDATE SET "
+    "repo_root=excluded.repo_root, stage=excluded.stage, "
+    "created_at=COALESCE(NULLIF(runs.created_at, ''), excluded.created_at), "
+    "status=excluded.status, pid=excluded.pid, pack=excluded.pack, profile=excluded.profile, "
+    "branch=excluded.branch, head_sha=excluded.head_sha, error=excluded.error, "
+    "started_at=excluded.started_at, updated_at=excluded.updated_at, "
+    "ended_at=excluded.ended_at, exit_code=excluded.exit_code"
+)
 
 
 def upsert_run_from_run_json(
-    con: sqlite3.Connection, *, repo_root: Path, run_id: str
+    con: sqlite3.Connection, *, repo_root: Path, run_id: str, commit: bool = True
 ) -> Optional[dict[str, Any]]:
     """Best-effort: upsert the `runs` row from `.noctune_cache/.../state/run.json`."""
     rp = repo_root / ".noctune_cache" / "runs" / run_id / "state" / "run.json"
@@ -247,24 +535,14 @@ def upsert_run_from_run_json(
     if not obj:
         return None
 
-    existing = con.execute(
-        "SELECT created_at FROM runs WHERE run_id=?", (run_id,)
-    ).fetchone()
-    created_at = (
-        (existing[0] if existing else None)
-        or str(obj.get("started_at") or "").strip()
-        or now_iso()
-    )
-
     con.execute(
-        "INSERT OR REPLACE INTO runs(run_id, repo_root, stage, rel_paths_json, created_at, status, pid, pack, profile, branch, head_sha, error, started_at, updated_at, ended_at, exit_code) "
-        "VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
+        _UPSERT_RUN_SQL,
         (
             str(obj.get("run_id") or run_id),
             str(repo_root),
             str(obj.get("stage") or ""),
             None,
-            created_at,
+            str(obj.get("started_at") or "").strip() or now_iso(),
             str(obj.get("status") or ""),
             obj.get("pid"),
             obj.get("pack"),
@@ -278,63 +556,115 @@ def upsert_run_from_run_json(
             obj.get("exit_code"),
         ),
     )
-    con.commit()
+    if commit:
+        con.commit()
     return obj
 
 
-def ingest_run_history(con: sqlite3.Connection, *, repo_root: Path, run_id: str) -> None:
+def ingest_run_history(
+    con: sqlite3.Connection, *, repo_root: Path, run_id: str, commit: bool = True
+) -> None:
     """Best-effort ingestion of run artifacts (events + approvals/decisions) into sqlite."""
     try:
-        _ingest_events(con, repo_root=repo_root, run_id=run_id)
+        _ingest_events(con, repo_root=repo_root, run_id=run_id, commit=commit)
     except Exception:
         pass
     try:
-        _ingest_approvals_and_decisions(con, repo_root=repo_root, run_id=run_id)
+        _ingest_approvals_and_decisions(
+            con, repo_root=repo_root, run_id=run_id, commit=commit
+        )
     except Exception:
         pass
 
 
-def _ingest_events(con: sqlite3.Connection, *, repo_root: Path, run_id: str) -> None:
+def ingest_many(con: sqlite3.Connection, *, repo_root: Path, run_ids: Iterable[str]) -> None:
+    """Ingest several runs' history in one transaction (one commit for all)."""
+    with immediate_txn(con):
+        for run_id in run_ids:
+            ingest_run_history(con, repo_root=repo_root, run_id=run_id, commit=False)
+
+
+def _ingest_events(
+    con: sqlite3.Connection, *, repo_root: Path, run_id: str, commit: bool = True
+) -> None:
     ep = repo_root / ".noctune_cache" / "runs" / run_id / "events" / "events.jsonl"
     if not ep.exists():
         ep = repo_root / ".noctune_cache" / "runs" / run_id / "logs" / "events.jsonl"
     if not ep.exists():
         return
 
+    sql = "INSERT OR IGNORE INTO events(run_id, idx, ts, type, msg, payload_json) VALUES(?,?,?,?,?,?)"
+    if commit:
+        with immediate_txn(con):
+            con.executemany(sql, _event_rows(ep, run_id))
+    else:
+        con.executemany(sql, _event_rows(ep, run_id))
+
+
+def _event_rows(
+    ep: Path, run_id: str
+) -> Iterator[tuple[str, int, str, str, Optional[str], bytes]]:
+    # The line is already a JSON object, so its bytes are stored as-is rather
+    # than re-serialized; parsing only extracts the indexed columns. Lines are
+    # framed on the mmap'd bytes and never decoded to text.
     idx = 0
-    with ep.open("r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            obj = _try_json_loads(line)
-            if obj:
-                typ = str(obj.get("type") or obj.get("event") or "")
-                ts = str(obj.get("ts") or obj.get("time") or obj.get("created_at") or "")
-                con.execute(
-                    "INSERT OR IGNORE INTO events(run_id, idx, ts, type, payload_json) VALUES(?,?,?,?,?)",
-                    (run_id, int(idx), ts, typ, json.dumps(obj, ensure_ascii=False)),
-                )
-            idx += 1
-    con.commit()
+    for line in _iter_lines(ep):
+        line = line.strip()
+        if not line:
+            continue
+        obj = _try_json_loads(line)
+        if obj:
+            typ = str(obj.get("type") or obj.get("event") or "")
+            ts = str(obj.get("ts") or obj.get("time") or obj.get("created_at") or "")
+            msg = obj.get("msg") or obj.get("message")
+            yield (run_id, idx, ts, typ, None if msg is None else str(msg), _pack_payload(line))
+        idx += 1
+
+
+def _iter_lines(path: Path) -> Iterator[bytes]:
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:  # mmap cannot map an empty file
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0
+            while (nl := mm.find(b"\n", pos)) >= 0:
+                yield mm[pos:nl]
+                pos = nl + 1
+            if pos < len(mm):
+                yield mm[pos:]
 
 
 def _ingest_approvals_and_decisions(
-    con: sqlite3.Connection, *, repo_root: Path, run_id: str
+    con: sqlite3.Connection, *, repo_root: Path, run_id: str, commit: bool = True
 ) -> None:
     ad = repo_root / ".noctune_cache" / "runs" / run_id / "state" / "approvals"
-    if not ad.exists():
+    try:
+        with os.scandir(ad) as it:
+            names = {e.name for e in it}
+    except OSError:
         return
 
-    for p in sorted(ad.glob("*.json")):
-        obj = _try_json_loads(p.read_text(encoding="utf-8", errors="replace"))
+    stems = sorted(n[: -len(".json")] for n in names if n.endswith(".json"))
+    if not stems:
+        return
+    # Reads are I/O-bound; fetch request/decision pairs in parallel.
+    with ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(stems))) as ex:
+        pairs = list(
+            ex.map(
+                lambda stem: _read_approval_files(ad, stem, f"{stem}.decision" in names),
+                stems,
+            )
+        )
+
+    approval_rows: list[tuple[Any, ...]] = []
+    decision_rows: list[tuple[Any, ...]] = []
+    for stem, (req_raw, dec_raw) in zip(stems, pairs):
+        obj = _try_json_loads(req_raw) if req_raw is not None else None
         if not obj:
             continue
 
-        approval_id = str(obj.get("approval_id") or p.stem)
-        con.execute(
-            "INSERT OR REPLACE INTO approvals(run_id, approval_id, created_at, file_path, symbol, risk_score, reason, diff, payload_json) "
-            "VALUES(?,?,?,?,?,?,?,?,?)",
+        approval_id = str(obj.get("approval_id") or stem)
+        approval_rows.append(
             (
                 run_id,
                 approval_id,
@@ -344,14 +674,13 @@ def _ingest_approvals_and_decisions(
                 obj.get("risk_score"),
                 obj.get("reason"),
                 obj.get("diff"),
-                json.dumps(obj, ensure_ascii=False),
-            ),
+                _pack_payload(jsonio.dumps(obj)),
+            )
         )
 
-        dp = p.with_suffix(".decision")
-        if not dp.exists():
+        if dec_raw is None:
             continue
-        raw = dp.read_text(encoding="utf-8", errors="replace").strip()
+        raw = dec_raw.strip()
         d = _try_json_loads(raw) or {}
         approved = d.get("approved")
         decision = None
@@ -359,17 +688,11 @@ def _ingest_approvals_and_decisions(
             decision = "approved" if approved else "rejected"
         elif raw:
             low = raw.lower()
-            decision = (
-                "approved"
-                if low.startswith("a") or low in ("true", "yes", "y")
-                else "rejected"
-            )
+            decision = "approved" if low[0] == "a" or low in _DECISION_TRUE else "rejected"
 
         if decision:
             payload = d if d else {"raw": raw}
-            con.execute(
-                "INSERT OR REPLACE INTO decisions(run_id, approval_id, decision, decided_at, decided_by, reason, payload_json) "
-                "VALUES(?,?,?,?,?,?,?)",
+            decision_rows.append(
                 (
                     run_id,
                     approval_id,
@@ -377,11 +700,51 @@ def _ingest_approvals_and_decisions(
                     payload.get("decided_at"),
                     payload.get("decided_by"),
                     payload.get("reason") or "",
-                    json.dumps(payload, ensure_ascii=False),
-                ),
+                    _pack_payload(jsonio.dumps(payload)),
+                )
             )
 
-    con.commit()
+    if commit:
+        with immediate_txn(con):
+            _insert_approval_rows(con, approval_rows, decision_rows)
+    else:
+        _insert_approval_rows(con, approval_rows, decision_rows)
+
+
+_READ_WORKERS = 16
+
+# Plain-text .decision files: anything starting with "a" (approve/approved) or
+# one of these reads as approved; everything else as rejected.
+_DECISION_TRUE = frozenset({"true", "yes", "y"})
+
+
+def _read_approval_files(
+    ad: Path, stem: str, has_decision: bool
+) -> tuple[Optional[str], Optional[str]]:
+    def read(name: str) -> Optional[str]:
+        try:
+            return (ad / name).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return None
+
+    return read(f"{stem}.json"), (read(f"{stem}.decision") if has_decision else None)
+
+
+def _insert_approval_rows(
+    con: sqlite3.Connection,
+    approval_rows: list[tuple[Any, ...]],
+    decision_rows: list[tuple[Any, ...]],
+) -> None:
+    con.executemany(
+        "INSERT OR REPLACE INTO approvals(run_id, approval_id, created_at, file_path, symbol, risk_score, reason, diff, payload_json) "
+        "VALUES(?,?,?,?,?,?,?,?,?)",
+        approval_rows,
+    )
+    con.executemany(
+        "INSERT OR REPLACE INTO decisions(run_id, approval_id, decision, decided_at, decided_by, reason, payload_json) "
+        "VALUES(?,?,?,?,?,?,?)",
+        decision_rows,
+    )
 
 
 def get_run(con: sqlite3.Connection, *, run_id: str) -> Optional[dict[str, Any]]:
@@ -390,30 +753,22 @@ def get_run(con: sqlite3.Connection, *, run_id: str) -> Optional[dict[str, Any]]
         "FROM runs WHERE run_id=?",
         (run_id,),
     ).fetchone()
-    if not row:
-        return None
-    return {
-        "run_id": row[0],
-        "repo_root": row[1],
-        "stage": row[2],
-        "created_at": row[3],
-        "status": row[4],
-        "pid": row[5],
-        "pack": row[6],
-        "profile": row[7],
-        "branch": row[8],
-        "head_sha": row[9],
-        "error": row[10],
-        "started_at": row[11],
-        "updated_at": row[12],
-        "ended_at": row[13],
-        "exit_code": row[14],
-    }
+    return dict(row) if row else None
 
 
 def tail_events(
-    con: sqlite3.Connection, *, run_id: str, cursor: Optional[int] = None, limit: int = 200
+    con: sqlite3.Connection,
+    *,
+    run_id: str,
+    cursor: Optional[int] = None,
+    limit: int = 200,
+    full: bool = False,
 ) -> tuple[list[dict[str, Any]], int, int]:
+    """
+    Page through a run's ingested events. By default each event is the indexed
+    columns ({idx, ts, type, msg}) and no payload is parsed; `full=True`
+    returns the original event objects.
+    """
     lim = max(1, int(limit))
     if cursor is None:
         mx = con.execute("SELECT MAX(idx) FROM events WHERE run_id=?", (run_id,)).fetchone()
@@ -422,54 +777,59 @@ def tail_events(
     else:
         start = max(0, int(cursor))
 
+    if not full:
+        rows = con.execute(
+            "SELECT idx, ts, type, msg FROM events WHERE run_id=? AND idx>=? ORDER BY idx ASC LIMIT ?",
+            (run_id, int(start), lim),
+        ).fetchall()
+        out = [dict(r) for r in rows]
+        next_cursor = (int(rows[-1][0]) + 1) if rows else start
+        return out, start, next_cursor
+
     rows = con.execute(
         "SELECT idx, payload_json FROM events WHERE run_id=? AND idx>=? ORDER BY idx ASC LIMIT ?",
         (run_id, int(start), lim),
     ).fetchall()
 
-    out: list[dict[str, Any]] = []
+    out = []
     last_idx = start
     for idx, payload_json in rows:
         last_idx = int(idx)
-        try:
-            out.append(json.loads(payload_json))
-        except Exception:
-            out.append({"idx": last_idx, "raw": payload_json})
+        obj = _parse_payload(payload_json)
+        out.append(
+            obj if obj is not None else {"idx": last_idx, "raw": _payload_text(payload_json)}
+        )
     next_cursor = (last_idx + 1) if rows else start
     return out, start, next_cursor
 
 
+_APPROVALS_WITH_DECISIONS_SQL = (
+    "SELECT "
+    "a.approval_id, a.created_at, a.file_path, a.symbol, a.risk_score, a.reason, a.diff, "
+    "a.payload_json AS approval_payload, "
+    "d.decision, d.decided_at, d.decided_by, d.reason AS decision_reason, "
+    "d.payload_json AS decision_payload "
+    "FROM approvals a "
+    "LEFT JOIN decisions d ON (d.run_id=a.run_id AND d.approval_id=a.approval_id) "
+    "WHERE a.run_id=? "
+    "ORDER BY a.created_at ASC, a.approval_id ASC"
+)
+
+
 def list_approvals_with_decisions(
     con: sqlite3.Connection, *, run_id: str
 ) -> list[dict[str, Any]]:
-    rows = con.execute(
-        "SELECT "
-        "a.approval_id, a.created_at, a.file_path, a.symbol, a.risk_score, a.reason, a.diff, a.payload_json, "
-        "d.decision, d.decided_at, d.decided_by, d.reason, d.payload_json "
-        "FROM approvals a "
-        "LEFT JOIN decisions d ON (d.run_id=a.run_id AND d.approval_id=a.approval_id) "
-        "WHERE a.run_id=? "
-        "ORDER BY a.created_at ASC, a.approval_id ASC",
-        (run_id,),
-    ).fetchall()
+    rows = con.execute(_APPROVALS_WITH_DECISIONS_SQL, (run_id,)).fetchall()
 
     out: list[dict[str, Any]] = []
     for r in rows:
-        out.append(
-            {
-                "approval_id": r[0],
-                "created_at": r[1],
-                "file_path": r[2],
-                "symbol": r[3],
-                "risk_score": r[4],
-                "reason": r[5],
-                "diff": r[6],
-                "approval_payload": _try_json_loads(r[7]) or {"raw": r[7]},
-                "decision": r[8],
-                "decided_at": r[9],
-                "decided_by": r[10],
-                "decision_reason": r[11],
-                "decision_payload": _try_json_loads(r[12]) or ({"raw": r[12]} if r[12] else None),
-            }
+        item = dict(r)
+        ap, dp = item["approval_payload"], item["decision_payload"]
+        item["approval_payload"] = (_parse_payload(ap) if ap else None) or {
+            "raw": _payload_text(ap) if ap else ap
+        }
+        item["decision_payload"] = (_parse_payload(dp) if dp else None) or (
+            {"raw": _payload_text(dp)} if dp else None
         )
+        out.append(item)
     return out
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from queue import Empty, Queue
+from typing import Any, Callable, Optional
+
+from .db import close_connection, connect, immediate_txn
+
+# Most closures queued by one wake-up that share a single transaction.
+_BATCH = 64
+
+_Item = Optional[tuple[Callable[[sqlite3.Connection], Any], Future]]
+
+
+class DbWriter(threading.Thread):
+    """
+    Single writer for one studio database. The thread opens and owns the write
+    connection (check_same_thread stays on); other threads `submit` closures
+    and wait on the returned Future. Closures queued together are applied in
+    one transaction, each under its own savepoint so a failing closure does
+    not undo the others. Closures must not commit: pass `commit=False` to the
+    db helpers. Once the thread has stopped (closed, or the connection could
+    not be opened) submissions fail immediately instead of waiting forever.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        super().__init__(name=f"noctune-db-writer:{db_path}", daemon=True)
+        self.db_path = db_path
+        self._q: Queue[_Item] = Queue()
+        self._submit_lock = threading.Lock()
+        self._dead: Optional[BaseException] = None
+
+    def submit(self, fn: Callable[[sqlite3.Connection], Any]) -> Future:
+        fut: Future = Future()
+        with self._submit_lock:
+            if self._dead is None:
+                self._q.put((fn, fut))
+                return fut
+            exc = self._dead
+        fut.set_exception(exc)
+        return fut
+
+    def close(self, timeout_s: float = 5.0) -> None:
+        """Apply everything already submitted, then stop the thread."""
+        self._q.put(None)
+        self.join(timeout=timeout_s)
+
+    def run(self) -> None:
+        try:
+            con = connect(self.db_path, check_same_thread=True)
+        except Exception as e:
+            self._fail_pending(e)
+            return
+        try:
+            stop = False
+            while not stop:
+                item = self._q.get()
+                if item is None:
+                    break
+                batch = [item]
+                while len(batch) < _BATCH:
+                    try:
+                        item = self._q.get_nowait()
+                    except Empty:
+                        break
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+                self._apply(con, batch)
+        finally:
+            self._fail_pending(RuntimeError(f"db writer for {self.db_path} is closed"))
+            close_connection(con)
+
+    def _fail_pending(self, exc: BaseException) -> None:
+        # Refuse new submissions first; everything queued before that is failed
+        # here, so no Future is left pending.
+        with self._submit_lock:
+            self._dead = exc
+        while True:
+            try:
+                item = self._q.get_nowait()
+            except Empty:
+                return
+            if item is not None and item[1].set_running_or_notify_cancel():
+                item[1].set_exception(exc)
+
+    def _apply(self, con: sqlite3.Connection, batch: list[tuple[Callable, Future]]) -> None:
+        batch = [(fn, fut) for fn, fut in batch if fut.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        results: list[tuple[Future, bool, Any]] = []
+        try:
+            with immediate_txn(con):
+                for fn, fut in batch:
+                    con.execute("SAVEPOINT job")
+                    try:
+                        res = fn(con)
+                    except Exception as e:
+                        con.execute("ROLLBACK TO job")
+                        con.execute("RELEASE job")
+                        results.append((fut, False, e))
+                    else:
+                        con.execute("RELEASE job")
+                        results.append((fut, True, res))
+        except Exception as e:
+            # The transaction itself failed (e.g. busy, or a closure committed):
+            # nothing in this batch is known to be applied.
+            for _, fut in batch:
+                fut.set_exception(e)
+            return
+        # Resolve only after the commit, so callers never see unsaved writes.
+        for fut, ok, val in results:
+            if ok:
+                fut.set_result(val)
+            else:
+                fut.set_exception(val)
+
+
+_WRITERS: dict[str, DbWriter] = {}
+_WRITERS_LOCK = threading.Lock()
+
+
+def writer_for(db_path: Path) -> DbWriter:
+    """Return the process-wide writer thread for `db_path`, starting it on first use."""
+    key = str(db_path)
+    with _WRITERS_LOCK:
+        w = _WRITERS.get(key)
+        if w is None or not w.is_alive():
+            w = DbWriter(db_path)
+            w.start()
+            _WRITERS[key] = w
+        return w
+
+
+def close_writers(timeout_s: float = 5.0) -> None:
+    """Drain and stop every writer thread (e.g. at server shutdown)."""
+    with _WRITERS_LOCK:
+        writers = list(_WRITERS.values())
+        _WRITERS.clear()
+    for w in writers:
+        w.close(timeout_s=timeout_s)
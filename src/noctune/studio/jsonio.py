@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    # Optional: orjson parses/emits bytes in C; the stdlib json is the fallback.
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which json.dumps emits; only such
+            # (or malformed) input pays twice. Note that orjson does not reject
+            # ints wider than 64 bits: it silently parses them as floats.
+            pass
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (non-ASCII is kept as-is)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson.JSONEncodeError (a TypeError): e.g. ints wider than 64 bits,
+            # which the stdlib fallback in loads() can produce.
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_str(obj: Any) -> str:
+    return dumps(obj).decode("utf-8")
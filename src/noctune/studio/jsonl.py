@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import mmap
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from . import jsonio
+
+# Sparse line index for append-only JSONL files (run events): remember the byte
+# offset of every _INDEX_STRIDE-th line so any line index is one seek plus a
+# short forward scan away, and only newly appended bytes are ever re-scanned.
+# Files are mmap'd and newlines located with find()/count(), which run at
+# memchr speed in C instead of iterating bytes in Python.
+_INDEX_STRIDE = 1024
+_CHUNK = 64 * 1024
+
+
+@dataclass
+class _LineIndex:
+    ino: int = 0
+    size: int = 0  # bytes indexed so far; always ends just past a "\n"
+    lines: int = 0  # complete lines in [0, size)
+    checkpoints: list[int] = field(default_factory=lambda: [0])
+
+
+_INDEXES: dict[str, _LineIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def _skip_lines(mm: mmap.mmap, pos: int, n: int, end: int) -> int:
+    """Return the offset just past the n-th newline at or after `pos`."""
+    for _ in range(n):
+        pos = mm.find(b"\n", pos, end) + 1
+    return pos
+
+
+def _refresh_index(
+    mm: mmap.mmap, key: str, fd: int
+) -> Optional[tuple[int, int, list[int]]]:
+    """
+    Extend the shared index over `mm` and return a snapshot (lines, size,
+    checkpoints) that lies entirely within it, or None when another call has
+    already indexed bytes appended after `mm` was mapped (remap and retry).
+    The shared index keeps changing after the lock is released, so callers
+    must only use the snapshot.
+    """
+    mapped = len(mm)
+    with _INDEXES_LOCK:
+        st = os.fstat(fd)
+        idx = _INDEXES.get(key)
+        if idx is None or idx.ino != st.st_ino or st.st_size < idx.size:
+            # new, replaced or truncated file: start over
+            idx = _LineIndex(ino=st.st_ino)
+            _INDEXES[key] = idx
+        if idx.size > mapped:
+            return None
+        # Only complete lines are indexed; a trailing partial line waits.
+        end = mm.rfind(b"\n", idx.size, mapped) + 1
+        pos = idx.size
+        while pos < end:
+            stop = min(end, pos + _CHUNK)
+            n = mm[pos:stop].count(b"\n")
+            to_next = _INDEX_STRIDE - idx.lines % _INDEX_STRIDE
+            while n >= to_next:
+                pos = _skip_lines(mm, pos, to_next, stop)
+                idx.lines += to_next
+                idx.checkpoints.append(pos)
+                n -= to_next
+                to_next = _INDEX_STRIDE
+            idx.lines += n
+            pos = stop
+        idx.size = max(idx.size, end)
+        return idx.lines, idx.size, idx.checkpoints[: idx.lines // _INDEX_STRIDE + 1]
+
+
+def _read_lines(
+    mm: mmap.mmap, checkpoints: list[int], size: int, start: int, count: int
+) -> list[bytes]:
+    k = start // _INDEX_STRIDE
+    pos = _skip_lines(mm, checkpoints[k], start - k * _INDEX_STRIDE, size)
+    end = _skip_lines(mm, pos, count, size)
+    return mm[pos : end - 1].split(b"\n")
+
+
+def tail_jsonl(
+    path: Path, *, cursor: Optional[int] = None, limit: int = 200
+) -> tuple[list[dict[str, Any]], int, int]:
+    """
+    Return (records, start, end) for complete lines [start, end) of a JSONL file.
+    With cursor=None the last `limit` lines are returned; otherwise reading
+    starts at line index `cursor`. A trailing line without "\\n" (a write in
+    progress) is not counted until it is complete. Lines that fail to parse
+    are skipped but still counted.
+    """
+    lim = max(1, int(limit))
+    try:
+        f = path.open("rb")
+    except OSError:
+        return [], 0, 0
+    with f:
+        while True:
+            if os.fstat(f.fileno()).st_size == 0:  # mmap cannot map an empty file
+                return [], 0, 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                snap = _refresh_index(mm, str(path), f.fileno())
+                if snap is None:
+                    continue  # the file grew since it was mapped
+                n, size, checkpoints = snap
+                if cursor is None:
+                    start = max(0, n - lim)
+                else:
+                    start = max(0, min(int(cursor), n))
+                end = min(n, start + lim)
+                raw_lines = (
+                    _read_lines(mm, checkpoints, size, start, end - start) if end > start else []
+                )
+                break
+
+    return _parse_lines(raw_lines), start, end
+
+
+def _parse_lines(raw_lines: list[bytes]) -> list[dict[str, Any]]:
+    # Fast path: the writer emits one JSON object per line, so the block parses
+    # as a single array in one C-level call. Any bad line (or one that smuggles
+    # in extra elements) sends the block down the per-line path instead.
+    if raw_lines:
+        try:
+            out = jsonio.loads(b"[" + b",".join(raw_lines) + b"]")
+        except Exception:
+            out = None
+        if isinstance(out, list) and len(out) == len(raw_lines):
+            return out
+    out = []
+    for ln in raw_lines:
+        try:
+            out.append(jsonio.loads(ln))
+        except Exception:
+            continue
+    return out
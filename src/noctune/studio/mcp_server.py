@@ -1,27 +1,26 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from pathlib import Path
 from typing import Any, Optional
 
+from ..core.approvals import write_decision
 from ..core.run_state import mark_failed_if_pid_gone, read_run_state
-from .db import connect, default_db_path, enqueue_job, list_jobs
-from .worker import start_run, stop_run
+from .db import borrow, default_db_path, enqueue_job, list_jobs
+from .db_writer import close_writers, writer_for
+from .jsonl import tail_jsonl
+from .worker import reap_children, start_run, stop_run
+
+# Upper bound on waiting for the db writer thread (sqlite's own busy_timeout
+# is 5s per statement); a stuck write surfaces as a tool error, not a hang.
+_WRITE_TIMEOUT_S = 30.0
 
 
 def _tail_events_jsonl(events_path: Path, *, max_lines: int = 100) -> list[dict[str, Any]]:
-    if not events_path.exists():
-        return []
+    # Shares the daemon's incremental line index: only appended bytes are
+    # scanned and only the returned lines are read and parsed.
     lim = max(1, min(int(max_lines), 500))
-    raw = events_path.read_text(encoding="utf-8", errors="replace").splitlines()
-    out: list[dict[str, Any]] = []
-    for ln in raw[-lim:]:
-        try:
-            out.append(json.loads(ln))
-        except Exception:
-            continue
-    return out
+    return tail_jsonl(events_path, limit=lim)[0]
 
 
 async def main() -> None:
@@ -45,15 +44,20 @@ async def main() -> None:
     @mcp.tool()
     def enqueue(repo_root: str, stage: str = "run") -> dict[str, Any]:
         root = Path(repo_root).resolve()
-        con = connect(default_db_path(root))
-        jid = enqueue_job(con, repo_root=str(root), stage=stage)
+        # Writes go through the database's writer thread, which batches
+        # concurrent tool calls into one transaction.
+        jid = (
+            writer_for(default_db_path(root))
+            .submit(lambda con: enqueue_job(con, repo_root=str(root), stage=stage, commit=False))
+            .result(timeout=_WRITE_TIMEOUT_S)
+        )
         return {"job_id": jid, "status": "queued"}
 
     @mcp.tool()
     def jobs(repo_root: str, limit: int = 20) -> dict[str, Any]:
         root = Path(repo_root).resolve()
-        con = connect(default_db_path(root))
-        return {"jobs": list_jobs(con, repo_root=str(root), limit=int(limit))}
+        with borrow(default_db_path(root)) as con:
+            return {"jobs": list_jobs(con, repo_root=str(root), limit=int(limit))}
 
     @mcp.tool()
     def events(repo_root: str, run_id: str, max_lines: int = 100) -> dict[str, Any]:
@@ -69,7 +73,9 @@ async def main() -> None:
         state_dir = root / ".noctune_cache" / "runs" / run_id / "state"
         if not state_dir.exists():
             return {"ok": False, "run": None}
-        # Best-effort: if pid is gone, mark failed.
+        # Best-effort: if pid is gone, mark failed (reap exited workers first,
+        # since a zombie still looks alive).
+        reap_children()
         mark_failed_if_pid_gone(str(state_dir))
         return {"ok": True, "run": read_run_state(str(state_dir))}
 
@@ -92,15 +98,14 @@ async def main() -> None:
     @mcp.tool()
     def approve(repo_root: str, run_id: str, approval_id: str, approved: bool, reason: str = "") -> dict[str, Any]:
         root = Path(repo_root).resolve()
-        ad = root / ".noctune_cache" / "runs" / run_id / "state" / "approvals"
-        ad.mkdir(parents=True, exist_ok=True)
-        (ad / f"{approval_id}.decision").write_text(
-            __import__("json").dumps({"approved": bool(approved), "reason": reason}, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        state_dir = root / ".noctune_cache" / "runs" / run_id / "state"
+        write_decision(str(state_dir), approval_id, approved=bool(approved), reason=reason)
         return {"ok": True}
 
-    await mcp.run_stdio_async()
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        close_writers()
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ import os
 import signal
 import subprocess
 import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -18,7 +19,40 @@ class RunHandle:
     pid: int
 
 
-def start_run(*, repo_root: Path, stage: str, rel_paths: Optional[list[str]] = None, extra_args: Optional[list[str]] = None) -> RunHandle:
+# Workers spawned by this process, by pid. Keeping the Popen handle lets the
+# runner harvest the real exit status (and reap the child) with one waitpid.
+# Handles in _KEEP_STATUS stay until child_status() collects their exit code;
+# any other exited worker is reaped and dropped by reap_children().
+_CHILDREN: dict[int, subprocess.Popen] = {}
+_KEEP_STATUS: set[int] = set()
+_CHILDREN_LOCK = threading.Lock()
+
+
+def reap_children() -> None:
+    """
+    Reap exited workers so they do not linger as zombies, which would still
+    look alive to pid probes. Exit codes the runner is waiting for are kept.
+    """
+    with _CHILDREN_LOCK:
+        for pid, p in list(_CHILDREN.items()):
+            if p.poll() is not None and pid not in _KEEP_STATUS:
+                del _CHILDREN[pid]
+
+
+def start_run(
+    *,
+    repo_root: Path,
+    stage: str,
+    rel_paths: Optional[list[str]] = None,
+    extra_args: Optional[list[str]] = None,
+    keep_exit_status: bool = False,
+) -> RunHandle:
+    """
+    Spawn a worker for `stage`. With keep_exit_status=True the caller must
+    collect the exit code through child_status(); otherwise the worker is
+    reaped by reap_children() once it exits.
+    """
+    reap_children()
     # Create run_id + cache dirs first so stop.flag works immediately.
     rp = ensure_run_paths(str(repo_root), None)
     run_id = rp.run_id
@@ -51,6 +85,10 @@ def start_run(*, repo_root: Path, stage: str, rel_paths: Optional[list[str]] = N
         stderr=subprocess.DEVNULL,
         start_new_session=True,
     )
+    with _CHILDREN_LOCK:
+        _CHILDREN[int(p.pid)] = p
+        if keep_exit_status:
+            _KEEP_STATUS.add(int(p.pid))
     try:
         update_run_state(rp.state_dir, pid=int(p.pid), status="running")
     except Exception:
@@ -58,24 +96,53 @@ def start_run(*, repo_root: Path, stage: str, rel_paths: Optional[list[str]] = N
     return RunHandle(run_id=run_id, pid=int(p.pid))
 
 
+def _write_stop_flag(state_dir: str) -> bool:
+    """Write and fsync stop.flag so the worker (or a restarted one) sees it."""
+    path = os.path.join(state_dir, "stop.flag")
+    try:
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        except FileNotFoundError:
+            # ensure_run_paths created the dir; only recreate it if it vanished.
+            os.makedirs(state_dir, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, b"stop\n")
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError:
+        return False
+    return True
+
+
 def stop_run(*, repo_root: Path, run_id: str, pid: Optional[int] = None) -> None:
     rp = ensure_run_paths(str(repo_root), run_id)
-    Path(rp.state_dir).mkdir(parents=True, exist_ok=True)
-    (Path(rp.state_dir) / "stop.flag").write_text("stop\n", encoding="utf-8")
+    flagged = _write_stop_flag(rp.state_dir)
     try:
         update_run_state(rp.state_dir, status="stopping", msg="stop requested")
     except Exception:
         pass
-    if pid:
+    # Signal only once the flag is on disk: a run that is killed before it
+    # notices the flag must still read as stopped, not crashed, on restart.
+    if pid and flagged:
         try:
             os.kill(pid, signal.SIGTERM)
         except Exception:
             pass
 
 
+# On Linux a stat of /proc/<pid> answers liveness without raising on the
+# common live path; kill(pid, 0) remains the portable probe.
+_PROC_PIDS = sys.platform.startswith("linux") and os.path.isdir("/proc/self")
+
+
 def pid_exists(pid: int) -> bool:
     if pid <= 0:
         return False
+    reap_children()
+    if _PROC_PIDS:
+        return os.path.exists(f"/proc/{pid}")
     try:
         # POSIX: signal 0 checks existence/permission.
         os.kill(pid, 0)
@@ -86,3 +153,32 @@ def pid_exists(pid: int) -> bool:
         return True
     except Exception:
         return True
+
+
+def open_pidfd(pid: int) -> Optional[int]:
+    """Return a pidfd for `pid` (Linux >= 5.3), or None where unsupported."""
+    if pid <= 0 or not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def child_status(pid: int) -> tuple[bool, Optional[int]]:
+    """
+    Return (alive, exit_code) for a worker pid. Workers started by this process
+    are polled through their Popen handle, which reaps them on exit and yields
+    the exit code; any other pid falls back to pid_exists() with exit_code None.
+    """
+    with _CHILDREN_LOCK:
+        p = _CHILDREN.get(pid)
+    if p is None:
+        return pid_exists(pid), None
+    rc = p.poll()
+    if rc is None:
+        return True, None
+    with _CHILDREN_LOCK:
+        _CHILDREN.pop(pid, None)
+        _KEEP_STATUS.discard(pid)
+    return False, rc
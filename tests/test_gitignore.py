@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def _load(tmp_path: Path, text: str):
+    from noctune.core.gitignore import GitIgnore
+
+    (tmp_path / ".gitignore").write_text(text, encoding="utf-8")
+    return GitIgnore.load(tmp_path)
+
+
+def test_gitignore_fast_paths_agree_with_pathspec(tmp_path: Path) -> None:
+    gi = _load(
+        tmp_path,
+        "# comment\nbuild\n*.pyc\n/foo\ndir/\nfoo/**/bar\n*_gen.py\ndocs/*.py\n",
+    )
+    assert gi.fast
+    paths = [
+        "build/x.py",
+        "src/build/x.py",
+        "src/x.pyc",
+        "foo/x.py",
+        "src/foo/x.py",
+        "dir/x.py",
+        "src/dir",
+        "foo/a/bar/x.py",
+        "src/m_gen.py",
+        "docs/conf.py",
+        "docs/api/conf.py",
+        "src/ok.py",
+    ]
+    for p in paths:
+        assert gi.is_ignored(p) == gi.spec.match_file(p), p
+
+
+def test_gitignore_negation_falls_back_to_pathspec(tmp_path: Path) -> None:
+    gi = _load(tmp_path, "*.py\n!keep.py\n")
+    assert not gi.fast
+    assert gi.is_ignored("src/drop.py")
+    assert not gi.is_ignored("src/keep.py")
+
+
+def test_gitignore_whitespace_matches_pathspec(tmp_path: Path) -> None:
+    gi = _load(tmp_path, " abc\nlead \n\t*.tmp\n #notcomment\nesc\\ \n   \n")
+    assert gi.fast
+    paths = [
+        "abc",
+        "src/ abc",
+        "lead",
+        "lead ",
+        "x.tmp",
+        "\tx.tmp",
+        " #notcomment",
+        "esc ",
+        "esc",
+    ]
+    for p in paths:
+        assert gi.is_ignored(p) == gi.spec.match_file(p), p
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def _write(p: Path, s: str = "") -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(s, encoding="utf-8")
+
+
+def test_from_file_list_resolves_and_filters(tmp_path: Path) -> None:
+    from noctune.core.scanner import RepoScanner
+
+    root = tmp_path / "repo"
+    _write(root / "pkg" / "a.py")
+    _write(root / "pkg" / "notes.txt")
+    _write(root / "build" / "gen.py")
+    _write(root / "skip.py")
+    _write(root / ".gitignore", "skip.py\n")
+    (root / "pkg" / "link.py").symlink_to(root / "pkg" / "notes.txt")
+    fl = tmp_path / "files.txt"
+    fl.write_text(
+        "# comment\npkg/a.py\npkg/../pkg/a.py\npkg/link.py\nmissing.py\nbuild/gen.py\nskip.py\n\n",
+        encoding="utf-8",
+    )
+
+    scanner = RepoScanner.create(root)
+    a = (root / "pkg" / "a.py").resolve()
+    assert scanner.from_file_list(fl) == [a, a]
+
+
+def _bump_mtime(p: Path) -> None:
+    # Some filesystems have coarse mtimes; make sure the change is visible.
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _rels(scanner, base: Path | None = None) -> list[str]:
+    return sorted(p.relative_to(scanner.root).as_posix() for p in scanner.iter_python_files(base))
+
+
+def test_iter_python_files_rescans_changed_dirs_and_gitignore(tmp_path: Path) -> None:
+    from noctune.core.scanner import RepoScanner
+
+    root = tmp_path / "repo"
+    _write(root / "pkg" / "a.py")
+    _write(root / "pkg" / "sub" / "b.py")
+    _write(root / "build" / "gen.py")
+    _write(root / "src" / "build" / "kept.py")
+    _write(root / "pkg" / "notes.txt")
+
+    scanner = RepoScanner.create(root)
+    assert _rels(scanner) == ["pkg/a.py", "pkg/sub/b.py", "src/build/kept.py"]
+
+    # A file added to an already-listed directory shows up on the next scan.
+    _write(root / "pkg" / "c.py")
+    _bump_mtime(root / "pkg")
+    assert _rels(scanner) == ["pkg/a.py", "pkg/c.py", "pkg/sub/b.py", "src/build/kept.py"]
+
+    # ... and a removed one disappears.
+    (root / "pkg" / "a.py").unlink()
+    _bump_mtime(root / "pkg")
+    assert _rels(scanner) == ["pkg/c.py", "pkg/sub/b.py", "src/build/kept.py"]
+
+    # Editing .gitignore is picked up without recreating the scanner.
+    _write(root / ".gitignore", "sub/\n")
+    _bump_mtime(root / ".gitignore")
+    assert _rels(scanner) == ["pkg/c.py", "src/build/kept.py"]
+
+
+def test_iter_python_files_from_subdir(tmp_path: Path) -> None:
+    from noctune.cli import _collect_rel_paths
+    from noctune.core.scanner import RepoScanner
+
+    root = tmp_path / "repo"
+    _write(root / "pkg" / "a.py")
+    _write(root / "pkg" / "sub" / "b.py")
+    _write(root / "other" / "c.py")
+
+    scanner = RepoScanner.create(root)
+    assert _rels(scanner, root / "pkg") == ["pkg/a.py", "pkg/sub/b.py"]
+    assert _collect_rel_paths(root.resolve(), ["pkg/sub"], None) == ["pkg/sub/b.py"]
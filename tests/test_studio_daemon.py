@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+
+def _stream_endpoint():
+    from noctune.studio.daemon import create_app
+
+    app = create_app()
+    return next(r.endpoint for r in app.routes if getattr(r, "path", "") == "/runs/{run_id}/events_stream")
+
+
+async def _next_chunk(resp) -> bytes:
+    return await asyncio.wait_for(resp.body_iterator.__anext__(), timeout=5)
+
+
+def test_events_stream_resumes_and_skips_partial_line(tmp_path: Path, monkeypatch) -> None:
+    from noctune.studio import daemon
+
+    ep = tmp_path / ".noctune_cache" / "runs" / "r1" / "events" / "events.jsonl"
+    ep.parent.mkdir(parents=True)
+    lines = [json.dumps({"i": i}).encode() + b"\n" for i in range(3)]
+    ep.write_bytes(b"".join(lines) + b'{"i": 3')  # last line still being written
+    first_end = len(lines[0])
+    endpoint = _stream_endpoint()
+
+    async def run() -> None:
+        # Last-Event-ID wins over ?offset= (EventSource reconnects to the same URL).
+        resp = await endpoint(
+            run_id="r1", repo_root=str(tmp_path), offset=0, last_event_id=str(first_end)
+        )
+        try:
+            chunk = await _next_chunk(resp)
+        finally:
+            await resp.body_iterator.aclose()
+        end1 = first_end + len(lines[1])
+        end2 = end1 + len(lines[2])
+        assert chunk == b'id: %d\ndata: {"i": 1}\n\nid: %d\ndata: {"i": 2}\n\n' % (end1, end2)
+
+        # A large backlog is read in bounded chunks, one event each here.
+        monkeypatch.setattr(daemon, "_STREAM_MAX_READ", 4)
+        resp = await endpoint(run_id="r1", repo_root=str(tmp_path), offset=0, last_event_id=None)
+        try:
+            chunks = [await _next_chunk(resp) for _ in range(3)]
+        finally:
+            await resp.body_iterator.aclose()
+        assert [c.split(b"data: ")[1] for c in chunks] == [ln[:-1] + b"\n\n" for ln in lines]
+
+    asyncio.run(run())
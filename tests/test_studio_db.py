@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from pathlib import Path
 
+import pytest
+
 
 def _write(p: Path, s: str) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
@@ -97,9 +100,91 @@ def test_studio_db_ingest_and_tail(tmp_path: Path) -> None:
     assert cur == 1
     assert next_cur == 3
     assert [e.get("type") for e in events] == ["log", "run_done"]
+    assert events[0]["msg"] == "hello"
+
+    full_events, _, _ = db_mod.tail_events(con, run_id=run_id, cursor=1, limit=1, full=True)
+    assert full_events == [{"type": "log", "ts": "2026-02-04T00:00:01Z", "msg": "hello"}]
 
     approvals = db_mod.list_approvals_with_decisions(con, run_id=run_id)
     assert len(approvals) == 1
     assert approvals[0]["approval_id"] == "a1"
     assert approvals[0]["decision"] == "approved"
 
+    # Re-ingesting (batched) is idempotent.
+    db_mod.ingest_many(con, repo_root=repo_root, run_ids=[run_id, "missing_run"])
+    assert not con.in_transaction
+    assert con.execute("SELECT COUNT(*) FROM events WHERE run_id=?", (run_id,)).fetchone()[0] == 3
+    assert len(db_mod.list_approvals_with_decisions(con, run_id=run_id)) == 1
+
+
+def test_studio_db_borrow_reuses_pooled_connections(tmp_path: Path) -> None:
+    from noctune.studio import db as db_mod
+
+    db_path = db_mod.default_db_path(tmp_path / "repo")
+    with db_mod.borrow(db_path, write=True) as w1:
+        db_mod.enqueue_job(w1, repo_root="r", stage="run")
+    with db_mod.borrow(db_path, write=True) as w2:
+        assert w2 is w1
+
+    with db_mod.borrow(db_path) as r1:
+        assert len(db_mod.list_jobs(r1, repo_root="r")) == 1
+    with db_mod.borrow(db_path) as r2:
+        assert r2 is r1
+        with pytest.raises(sqlite3.OperationalError):
+            r2.execute("DELETE FROM jobs")
+
+
+def test_studio_db_large_payloads_are_compressed(tmp_path: Path) -> None:
+    from noctune.studio import db as db_mod
+
+    repo_root = tmp_path / "repo"
+    run_id = "r1"
+    big = {"type": "log", "msg": "x" * 4096}
+    _write(
+        repo_root / ".noctune_cache" / "runs" / run_id / "events" / "events.jsonl",
+        json.dumps({"type": "start"}) + "\n" + json.dumps(big) + "\n",
+    )
+    con = db_mod.connect(db_mod.default_db_path(repo_root))
+    db_mod.ingest_run_history(con, repo_root=repo_root, run_id=run_id)
+
+    sizes = [r[0] for r in con.execute("SELECT length(payload_json) FROM events ORDER BY idx")]
+    assert sizes[1] < 4096
+    events, _, _ = db_mod.tail_events(con, run_id=run_id, cursor=0, full=True)
+    assert events == [{"type": "start"}, big]
+
+
+@pytest.mark.parametrize("has_returning", [True, False])
+def test_studio_db_claim_next_job(tmp_path: Path, monkeypatch, has_returning: bool) -> None:
+    from noctune.studio import db as db_mod
+
+    monkeypatch.setattr(db_mod, "_HAS_RETURNING", has_returning)
+    con = db_mod.connect(db_mod.default_db_path(tmp_path / "repo"))
+    first = db_mod.enqueue_job(con, repo_root="r", stage="a", rel_paths=["x.py"])
+    db_mod.enqueue_job(con, repo_root="r", stage="b")
+
+    job = db_mod.claim_next_job(con, repo_root="r")
+    assert job == {"job_id": first, "stage": "a", "rel_paths": ["x.py"], "extra_args": None}
+    assert not con.in_transaction
+    assert db_mod.claim_next_job(con, repo_root="r")["stage"] == "b"
+    assert db_mod.claim_next_job(con, repo_root="r") is None
+    assert {j["status"] for j in db_mod.list_jobs(con, repo_root="r")} == {"starting"}
+
+
+def test_studio_db_borrow_reopens_after_db_file_removed(tmp_path: Path) -> None:
+    import shutil
+
+    from noctune.studio import db as db_mod
+
+    repo_root = tmp_path / "repo"
+    db_path = db_mod.default_db_path(repo_root)
+    with db_mod.borrow(db_path, write=True) as w:
+        db_mod.enqueue_job(w, repo_root="r", stage="old")
+    with db_mod.borrow(db_path) as r:
+        assert len(db_mod.list_jobs(r, repo_root="r")) == 1
+
+    shutil.rmtree(db_path.parent)
+    with db_mod.borrow(db_path, write=True) as w:
+        db_mod.enqueue_job(w, repo_root="r", stage="new")
+    assert db_path.exists()
+    with db_mod.borrow(db_path) as r:
+        assert [j["stage"] for j in db_mod.list_jobs(r, repo_root="r")] == ["new"]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+def test_db_writer_batches_and_isolates_failures(tmp_path: Path) -> None:
+    from noctune.studio import db as db_mod
+    from noctune.studio.db_writer import DbWriter
+
+    db_path = db_mod.default_db_path(tmp_path / "repo")
+    w = DbWriter(db_path)
+
+    def boom(con):
+        db_mod.enqueue_job(con, repo_root="r", stage="lost", commit=False)
+        raise RuntimeError("boom")
+
+    # Queued before the thread starts, so all three land in one batch.
+    f1 = w.submit(lambda con: db_mod.enqueue_job(con, repo_root="r", stage="a", commit=False))
+    f2 = w.submit(boom)
+    f3 = w.submit(lambda con: db_mod.enqueue_job(con, repo_root="r", stage="b", commit=False))
+    w.start()
+    assert f1.result(timeout=5) == 1
+    with pytest.raises(RuntimeError):
+        f2.result(timeout=5)
+    assert isinstance(f3.result(timeout=5), int)
+    w.close()
+    assert not w.is_alive()
+
+    con = db_mod.connect(db_path)
+    assert [j["stage"] for j in db_mod.list_jobs(con, repo_root="r")] == ["b", "a"]
+
+
+def test_db_writer_fails_submissions_when_connect_fails(tmp_path: Path) -> None:
+    from noctune.studio.db_writer import DbWriter
+
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("", encoding="utf-8")
+    w = DbWriter(blocker / "studio.db")
+    queued = w.submit(lambda con: None)
+    w.start()
+    w.join(timeout=5)
+    assert not w.is_alive()
+    with pytest.raises(OSError):
+        queued.result(timeout=5)
+    with pytest.raises(OSError):
+        w.submit(lambda con: None).result(timeout=5)
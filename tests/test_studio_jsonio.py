@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+
+def test_jsonio_round_trips_what_only_the_stdlib_accepts() -> None:
+    from noctune.studio import jsonio
+
+    # NaN sends loads() to the stdlib, which keeps the 100-bit int exact;
+    # dumps() must then fall back too instead of raising.
+    obj = jsonio.loads(b'{"big": 1234567890123456789012345678901, "x": NaN, "s": "\\u00e9"}')
+    assert obj["big"] == 1234567890123456789012345678901
+    assert jsonio.loads(jsonio.dumps(obj))["big"] == obj["big"]
+    assert jsonio.dumps_str({"s": "é", 1: 2}) == '{"s":"é","1":2}'
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+
+def test_tail_jsonl_cursor_and_partial_line(tmp_path: Path, monkeypatch) -> None:
+    from noctune.studio import jsonl
+
+    monkeypatch.setattr(jsonl, "_INDEX_STRIDE", 4)
+    p = tmp_path / "events.jsonl"
+    p.write_text("".join(json.dumps({"i": i}) + "\n" for i in range(10)), encoding="utf-8")
+
+    events, cur, next_cur = jsonl.tail_jsonl(p, cursor=None, limit=3)
+    assert (cur, next_cur) == (7, 10)
+    assert [e["i"] for e in events] == [7, 8, 9]
+
+    events, cur, next_cur = jsonl.tail_jsonl(p, cursor=5, limit=2)
+    assert (cur, next_cur) == (5, 7)
+    assert [e["i"] for e in events] == [5, 6]
+
+    # An in-progress (unterminated) line is not visible until it is complete.
+    with p.open("a", encoding="utf-8") as f:
+        f.write('{"i": 10')
+    assert jsonl.tail_jsonl(p, cursor=10, limit=5) == ([], 10, 10)
+    with p.open("a", encoding="utf-8") as f:
+        f.write("}\n")
+    assert jsonl.tail_jsonl(p, cursor=10, limit=5) == ([{"i": 10}], 10, 11)
+
+
+def test_tail_jsonl_missing_file(tmp_path: Path) -> None:
+    from noctune.studio.jsonl import tail_jsonl
+
+    assert tail_jsonl(tmp_path / "nope.jsonl") == ([], 0, 0)
+
+
+def test_tail_jsonl_skips_malformed_lines(tmp_path: Path) -> None:
+    from noctune.studio.jsonl import tail_jsonl
+
+    p = tmp_path / "events.jsonl"
+    p.write_bytes(b'{"i": 0}\nnot json\n\n{"i": 3}\n')
+    assert tail_jsonl(p, cursor=0, limit=10) == ([{"i": 0}, {"i": 3}], 0, 4)
+
+
+def test_tail_jsonl_stale_mapping_does_not_use_grown_index(tmp_path: Path) -> None:
+    import mmap
+
+    from noctune.studio import jsonl
+
+    p = tmp_path / "events.jsonl"
+    p.write_text("".join(json.dumps({"i": i}) + "\n" for i in range(5)), encoding="utf-8")
+    with p.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Another reader indexes lines appended after this file was mapped.
+        with p.open("a", encoding="utf-8") as w:
+            w.write("".join(json.dumps({"i": i}) + "\n" for i in range(5, 10)))
+        assert jsonl.tail_jsonl(p, cursor=None, limit=3)[1:] == (7, 10)
+        assert jsonl._refresh_index(mm, str(p), f.fileno()) is None
+
+    events, cur, next_cur = jsonl.tail_jsonl(p, cursor=7, limit=3)
+    assert ([e["i"] for e in events], cur, next_cur) == ([7, 8, 9], 7, 10)
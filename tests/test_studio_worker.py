@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+
+def _proc_state(pid: int) -> str:
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as f:
+            return f.read().rsplit(")", 1)[1].split()[0]
+    except FileNotFoundError:
+        return ""
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="needs procfs")
+def test_started_worker_is_reaped_and_reported_gone(tmp_path: Path) -> None:
+    from noctune.core.run_state import mark_failed_if_pid_gone
+    from noctune.studio import worker
+
+    # An unknown stage makes the worker exit straight away.
+    h = worker.start_run(repo_root=tmp_path, stage="no-such-stage")
+    deadline = time.monotonic() + 30
+    while _proc_state(h.pid) != "Z" and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert _proc_state(h.pid) == "Z"
+
+    assert not worker.pid_exists(h.pid)
+    assert _proc_state(h.pid) == ""
+    assert h.pid not in worker._CHILDREN
+
+    state_dir = tmp_path / ".noctune_cache" / "runs" / h.run_id / "state"
+    assert mark_failed_if_pid_gone(str(state_dir))["status"] == "failed"
+
+    # A runner-owned worker keeps its exit code through sweeps until collected.
+    h = worker.start_run(repo_root=tmp_path, stage="no-such-stage", keep_exit_status=True)
+    deadline = time.monotonic() + 30
+    while _proc_state(h.pid) != "Z" and time.monotonic() < deadline:
+        time.sleep(0.05)
+    worker.reap_children()
+    alive, code = worker.child_status(h.pid)
+    assert not alive and code not in (None, 0)
+    assert h.pid not in worker._CHILDREN